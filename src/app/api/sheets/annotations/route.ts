@@ -1,5 +1,6 @@
 import {
   appendAnnotationRows,
+  isSheetAppendError,
   isSheetConfigError,
   readSheetRows,
 } from "@/lib/google-sheets";
@@ -34,7 +35,7 @@ export async function GET() {
       });
     }
 
-    console.error(error);
+    console.error("Failed to load annotations from Google Sheets:", error);
     return NextResponse.json(
       {
         configured: true,
@@ -73,9 +74,13 @@ export async function POST(request: Request) {
       );
     }
 
-    console.error(error);
+    console.error("Failed to sync annotations to Google Sheets:", error);
     return NextResponse.json(
-      { ok: false, message: "Could not sync annotations to Google Sheets." },
+      {
+        ok: false,
+        message: "Could not sync annotations to Google Sheets.",
+        appendedRows: isSheetAppendError(error) ? error.appendedRows : 0,
+      },
       { status: 502 },
     );
   }
@@ -18,7 +18,7 @@ export async function GET() {
       });
     }
 
-    console.error(error);
+    console.error("Failed to load assignments from Google Sheets:", error);
     return NextResponse.json(
       {
         configured: true,
@@ -7,18 +7,20 @@ export const runtime = "nodejs";
 export async function GET(request: Request) {
   const url = new URL(request.url);
   const path = url.searchParams.get("path") ?? "";
+  const thumbnail = url.searchParams.get("thumbnail") === "1";
+  const isVersioned = url.searchParams.has("v");
 
   if (!path) {
     return NextResponse.json({ message: "Missing Synology image path." }, { status: 400 });
   }
 
   try {
-    const response = await downloadSynologyImage(path);
+    const response = await downloadSynologyImage(path, { thumbnail });
     return new Response(response.body, {
       status: 200,
       headers: {
         "Content-Type": response.headers.get("Content-Type") ?? "application/octet-stream",
-        "Cache-Control": "private, max-age=300",
+        "Cache-Control": isVersioned ? "private, max-age=86400, immutable" : "private, max-age=300",
       },
     });
   } catch (error) {
@@ -26,7 +28,7 @@ export async function GET(request: Request) {
       return NextResponse.json({ message: error.message }, { status: 400 });
     }
 
-    console.error(error);
+    console.error("Synology image proxy failed for %s:", path, error);
     return NextResponse.json({ message: getSynologyUserMessage(error) }, { status: 502 });
   }
 }
@@ -30,7 +30,7 @@ export async function GET(request: Request) {
       );
     }
 
-    console.error(error);
+    console.error("Synology folder listing failed for %s:", folder || status.defaultFolder, error);
     return NextResponse.json(
       { ...status, images: [], message: getSynologyUserMessage(error) },
       { status: 502 },
@@ -1,10 +1,14 @@
 "use client";
 
 import { useState, useEffect } from "react";
+import dynamic from "next/dynamic";
 import { AnnotationWorkspace } from "@/components/AnnotationWorkspace";
-import { ManagementDashboard } from "@/components/ManagementDashboard";
 import { initDynamicSupabase } from "@/lib/supabase";
 
+const ManagementDashboard = dynamic(() =>
+  import("@/components/ManagementDashboard").then((module) => module.ManagementDashboard),
+);
+
 export default function HomePage() {
   const [view, setView] = useState<"workspace" | "dashboard">("workspace");
   const [isConfigLoaded, setIsConfigLoaded] = useState(false);
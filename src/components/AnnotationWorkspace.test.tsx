@@ -1,6 +1,6 @@
-import { render, screen, waitFor, within } from "@testing-library/react";
+import { act, render, screen, waitFor, within } from "@testing-library/react";
 import userEvent from "@testing-library/user-event";
-import { describe, expect, test } from "vitest";
+import { describe, expect, test, vi } from "vitest";
 import { AnnotationWorkspace } from "./AnnotationWorkspace";
 import type { AnnotationRecord } from "@/lib/annotation-data";
 
@@ -20,6 +20,17 @@ const storedAnnotation: AnnotationRecord = {
   Notes: "Initial note",
 };
 
+const completeDraft = {
+  site: "Location 1",
+  camera: "LOC001",
+  retrievalDate: "2026-04-24",
+  type: "Seabird",
+  species: "Black-footed Albatross (Phoebastria nigripes)",
+  behavior: "Cleaning",
+  reviewerName: "KG",
+  notes: "",
+};
+
 describe("AnnotationWorkspace", () => {
   test("shows uploaded images in contain mode so the whole frame is visible", async () => {
     const user = userEvent.setup();
@@ -32,6 +43,18 @@ describe("AnnotationWorkspace", () => {
     expect(image).toHaveClass("viewer-image--contain");
   });
 
+  test("orders uploaded images by file name", async () => {
+    const user = userEvent.setup();
+    render(<AnnotationWorkspace />);
+
+    await user.upload(screen.getByLabelText(/add nest camera images/i), [
+      new File(["image"], "frame-002.jpg", { type: "image/jpeg" }),
+      new File(["image"], "frame-001.jpg", { type: "image/jpeg" }),
+    ]);
+
+    expect(await screen.findByAltText("frame-001.jpg")).toHaveClass("viewer-image--contain");
+  });
+
   test("can edit and delete a saved local annotation", async () => {
     window.localStorage.setItem(
       "seabird-nestcam-annotations-v1",
@@ -59,4 +82,120 @@ describe("AnnotationWorkspace", () => {
       ).not.toBeInTheDocument();
     });
   });
+
+  test("saving during a sync keeps the new row and does not resend the sent ones", async () => {
+    window.localStorage.setItem(
+      "seabird-nestcam-annotations-v1",
+      JSON.stringify([storedAnnotation]),
+    );
+    window.localStorage.setItem("seabird-nestcam-draft-v1", JSON.stringify(completeDraft));
+
+    const defaultFetch = vi.mocked(fetch).getMockImplementation()!;
+    const insertedBatches: Array<Array<Record<string, unknown>>> = [];
+    let finishInsert = () => {};
+    vi.mocked(fetch).mockImplementation(async (input, init) => {
+      if (init?.method === "POST" && String(input).includes("/rest/v1/annotations")) {
+        insertedBatches.push(JSON.parse(String(init.body)));
+        await new Promise<void>((resolve) => {
+          finishInsert = resolve;
+        });
+        return new Response(null, { status: 201 });
+      }
+      return defaultFetch(input, init);
+    });
+
+    const user = userEvent.setup();
+    render(<AnnotationWorkspace />);
+
+    await user.upload(
+      screen.getByLabelText(/add nest camera images/i),
+      new File(["image"], "image-010.jpg", { type: "image/jpeg" }),
+    );
+    await screen.findByAltText("image-010.jpg");
+
+    await user.click(screen.getByRole("button", { name: /sync rows/i }));
+    await waitFor(() => expect(insertedBatches).toHaveLength(1));
+    expect(screen.getByRole("button", { name: /edit annotation/i })).toBeDisabled();
+
+    await user.click(screen.getByRole("button", { name: /^single$/i }));
+    await user.click(screen.getByRole("button", { name: /save annotation/i }));
+    finishInsert();
+
+    await waitFor(() => {
+      expect(screen.getByText("Successfully synced 1 rows to Supabase.")).toBeInTheDocument();
+    });
+    const savedRows = JSON.parse(
+      window.localStorage.getItem("seabird-nestcam-annotations-v1") ?? "[]",
+    ) as AnnotationRecord[];
+    expect(savedRows.map((row) => row["Start Filename"])).toEqual(["image-010.jpg"]);
+
+    await user.click(screen.getByRole("button", { name: /sync rows/i }));
+    await waitFor(() => expect(insertedBatches).toHaveLength(2));
+    finishInsert();
+
+    expect(insertedBatches.map((batch) => batch.map((row) => row.start_filename))).toEqual([
+      ["image-001.jpg"],
+      ["image-010.jpg"],
+    ]);
+  });
+
+  test("warns when saved annotations cannot be written to local storage", async () => {
+    window.localStorage.setItem(
+      "seabird-nestcam-annotations-v1",
+      JSON.stringify([storedAnnotation]),
+    );
+
+    const user = userEvent.setup();
+    render(<AnnotationWorkspace />);
+
+    await screen.findByRole("button", { name: /delete annotation/i });
+    Object.defineProperty(window, "localStorage", {
+      configurable: true,
+      value: {
+        ...window.localStorage,
+        setItem: vi.fn(() => {
+          throw new DOMException("Storage is full", "QuotaExceededError");
+        }),
+      },
+    });
+    await user.click(screen.getByRole("button", { name: /delete annotation/i }));
+
+    expect(
+      await screen.findByText(
+        "Annotations could not be saved in this browser. Sync or export them before closing the tab.",
+      ),
+    ).toBeInTheDocument();
+  });
+
+  test("sends the rows once when both sync buttons are clicked before a re-render", async () => {
+    window.localStorage.setItem(
+      "seabird-nestcam-annotations-v1",
+      JSON.stringify([storedAnnotation]),
+    );
+
+    const defaultFetch = vi.mocked(fetch).getMockImplementation()!;
+    let insertCount = 0;
+    vi.mocked(fetch).mockImplementation(async (input, init) => {
+      if (init?.method === "POST" && String(input).includes("/rest/v1/annotations")) {
+        insertCount += 1;
+        return new Response(null, { status: 201 });
+      }
+      return defaultFetch(input, init);
+    });
+
+    render(<AnnotationWorkspace />);
+    await screen.findByRole("button", { name: /delete annotation/i });
+
+    const headerSyncButton = screen.getByRole("button", { name: /^sync$/i });
+    const rowsSyncButton = screen.getByRole("button", { name: /sync rows/i });
+    act(() => {
+      headerSyncButton.click();
+      rowsSyncButton.click();
+    });
+
+    await waitFor(() => {
+      expect(screen.getByText("Successfully synced 1 rows to Supabase.")).toBeInTheDocument();
+    });
+    expect(insertCount).toBe(1);
+  });
 });
@@ -1,16 +1,11 @@
 "use client";
 
-import { useCallback, useEffect, useMemo, useRef, useState } from "react";
+import { memo, type ReactElement, useCallback, useEffect, useMemo, useRef, useState } from "react";
+import { readExifCaptureTime } from "@/lib/exif";
 import { supabase } from "@/lib/supabase";
 import {
   ANNOTATION_COLUMNS,
   ANNOTATION_TEMPLATES,
-  CAMERAS,
-  SITE_LOCATIONS,
-  SEABIRD_SPECIES,
-  PREDATOR_SPECIES,
-  SEABIRD_BEHAVIORS,
-  PREDATOR_BEHAVIORS,
   type AnnotationRecord,
   type ObservationType,
   type DynamicChoices,
@@ -42,6 +37,8 @@ type LocalImage = {
   id: string;
   name: string;
   url: string;
+  thumbnailUrl?: string;
+  file?: File;
   size: number;
   captureTime: string;
   lastModified: number;
@@ -60,6 +57,25 @@ type AnnotationDraft = {
   notes: string;
 };
 
+type SequenceMarks = {
+  startIndex: number | null;
+  endIndex: number | null;
+  startTime: string;
+  endTime: string;
+  isSingleImage: boolean;
+};
+
+type ThumbnailBadge = "start" | "end" | "reviewed";
+
+type ThumbnailBatch = {
+  requested: Set<string>;
+  queue: Array<{ id: string; file: File }>;
+  nextJob: number;
+  finished: Map<string, string>;
+  flushTimer: number | null;
+  isRunning: boolean;
+};
+
 type SheetApiResponse = {
   configured: boolean;
   headers: string[];
@@ -79,6 +95,7 @@ type SynologyListResponse = {
     size: number;
     captureTime: string;
     url: string;
+    thumbnailUrl: string;
   }>;
   message?: string;
 };
@@ -92,6 +109,31 @@ const DRAFT_STORAGE_KEY = "seabird-nestcam-draft-v1";
 const ANNOTATIONS_STORAGE_KEY = "seabird-nestcam-annotations-v1";
 const REVIEWED_STORAGE_KEY = "seabird-nestcam-reviewed-v1";
 const THUMBNAIL_WINDOW_SIZE = 48;
+const THUMBNAIL_WIDTH = 160;
+const CAPTURE_TIME_READERS = 8;
+const THUMBNAIL_WORKERS = 4;
+const THUMBNAIL_FLUSH_MS = 100;
+const RECENT_ANNOTATION_COUNT = 8;
+const CSV_HEADER = ANNOTATION_COLUMNS.join(",");
+const compareNames = new Intl.Collator().compare;
+
+const emptyMarks: SequenceMarks = {
+  startIndex: null,
+  endIndex: null,
+  startTime: "",
+  endTime: "",
+  isSingleImage: false,
+};
+
+const noChoices: string[] = [];
+
+const lastStoredJson = new Map<string, string>();
+
+const thumbnailBadgeIcons: Record<ThumbnailBadge, ReactElement> = {
+  start: <StartIcon size={14} />,
+  end: <EndIcon size={14} />,
+  reviewed: <CheckIcon size={14} />,
+};
 
 const emptySheetResponse: SheetApiResponse = {
   configured: false,
@@ -99,8 +141,35 @@ const emptySheetResponse: SheetApiResponse = {
   rows: [],
 };
 
-function todayInputValue() {
-  return new Date().toISOString().slice(0, 10);
+const annotationsTableHead = (
+  <thead>
+    <tr>
+      <th>Type</th>
+      <th>Start</th>
+      <th>End</th>
+      <th>Species</th>
+      <th>Behavior</th>
+      <th>Reviewer</th>
+      <th>Actions</th>
+    </tr>
+  </thead>
+);
+
+const emptyAnnotationsRow = (
+  <tr>
+    <td colSpan={7}>No local annotations saved yet.</td>
+  </tr>
+);
+
+function createThumbnailBatch(): ThumbnailBatch {
+  return {
+    requested: new Set(),
+    queue: [],
+    nextJob: 0,
+    finished: new Map(),
+    flushTimer: null,
+    isRunning: false,
+  };
 }
 
 function createDefaultDraft(): AnnotationDraft {
@@ -123,22 +192,33 @@ function readStoredJson<T>(key: string, fallback: T): T {
 
   try {
     const storedValue = window.localStorage.getItem(key);
-    return storedValue ? (JSON.parse(storedValue) as T) : fallback;
+    if (!storedValue) {
+      lastStoredJson.delete(key);
+      return fallback;
+    }
+    lastStoredJson.set(key, storedValue);
+    return JSON.parse(storedValue) as T;
   } catch {
     return fallback;
   }
 }
 
+// Returns false when the browser refuses the write (quota or disabled storage).
 function writeStoredJson(key: string, value: unknown) {
   if (typeof window === "undefined") {
-    return;
+    return true;
   }
 
-  window.localStorage.setItem(key, JSON.stringify(value));
-}
-
-function padDatePart(value: number) {
-  return String(value).padStart(2, "0");
+  try {
+    const serializedValue = JSON.stringify(value);
+    if (lastStoredJson.get(key) !== serializedValue) {
+      window.localStorage.setItem(key, serializedValue);
+      lastStoredJson.set(key, serializedValue);
+    }
+    return true;
+  } catch {
+    return false;
+  }
 }
 
 function formatDateTime(timestamp: number) {
@@ -147,17 +227,140 @@ function formatDateTime(timestamp: number) {
     return "";
   }
 
-  return `${date.getFullYear()}-${padDatePart(date.getMonth() + 1)}-${padDatePart(
-    date.getDate(),
-  )} ${padDatePart(date.getHours())}:${padDatePart(date.getMinutes())}:${padDatePart(
-    date.getSeconds(),
-  )}`;
+  // Shift by the local offset so the ISO string reads as local time.
+  return new Date(timestamp - date.getTimezoneOffset() * 60_000)
+    .toISOString()
+    .replace("T", " ")
+    .slice(0, 19);
+}
+
+function todayInputValue() {
+  return formatDateTime(Date.now()).slice(0, 10);
 }
 
 function isImageFile(file: File) {
   return file.type.startsWith("image/") || /\.(jpe?g|png|webp)$/i.test(file.name);
 }
 
+function isJpegFile(file: File) {
+  return file.type === "image/jpeg" || /\.jpe?g$/i.test(file.name);
+}
+
+function sortFilesByName(files: File[]) {
+  const isSorted = files.every(
+    (file, fileIndex) => fileIndex === 0 || compareNames(files[fileIndex - 1].name, file.name) <= 0,
+  );
+  return isSorted ? files : files.sort((firstFile, secondFile) => compareNames(firstFile.name, secondFile.name));
+}
+
+function canvasToBlob(canvas: HTMLCanvasElement, type: string, quality: number) {
+  return new Promise<Blob | null>((resolve) => canvas.toBlob(resolve, type, quality));
+}
+
+// Returns null where the browser cannot resize or decode the file.
+async function createThumbnailUrl(file: File) {
+  if (typeof createImageBitmap !== "function") {
+    return null;
+  }
+
+  let bitmap: ImageBitmap;
+  try {
+    bitmap = await createImageBitmap(file, { resizeWidth: THUMBNAIL_WIDTH, resizeQuality: "low" });
+  } catch {
+    return null;
+  }
+
+  const canvas = document.createElement("canvas");
+  try {
+    canvas.width = bitmap.width;
+    canvas.height = bitmap.height;
+    const context = canvas.getContext("2d");
+    if (!context) {
+      return null;
+    }
+    context.drawImage(bitmap, 0, 0);
+  } catch {
+    return null;
+  } finally {
+    bitmap.close();
+  }
+
+  try {
+    // Browsers that cannot encode WebP quietly hand back a PNG instead.
+    const webpBlob = await canvasToBlob(canvas, "image/webp", 0.6);
+    const blob = webpBlob?.type === "image/webp" ? webpBlob : await canvasToBlob(canvas, "image/jpeg", 0.75);
+    return blob ? URL.createObjectURL(blob) : null;
+  } catch {
+    return null;
+  } finally {
+    canvas.width = 0;
+    canvas.height = 0;
+  }
+}
+
+// Each worker keeps taking the next job until takeNext returns undefined, so
+// jobs queued while the pool is running are picked up by the same workers.
+async function runBoundedJobs<T>(
+  limit: number,
+  takeNext: () => T | undefined,
+  runJob: (job: T) => Promise<void>,
+) {
+  const work = async () => {
+    for (let job = takeNext(); job !== undefined; job = takeNext()) {
+      await runJob(job);
+    }
+  };
+  await Promise.all(Array.from({ length: limit }, work));
+}
+
+const captureTimeCache = new Map<string, Promise<string>>();
+
+function readCachedCaptureTime(file: File) {
+  const cacheKey = `${file.name}-${file.size}-${file.lastModified}`;
+  let captureTime = captureTimeCache.get(cacheKey);
+  if (!captureTime) {
+    captureTime = readExifCaptureTime(file).catch(() => "");
+    captureTimeCache.set(cacheKey, captureTime);
+  }
+  return captureTime;
+}
+
+// Files without a readable EXIF date keep the last-modified time they were
+// loaded with, so they are left out of the returned map.
+async function readCaptureTimes(images: LocalImage[], signal: AbortSignal) {
+  const captureTimes: string[] = [];
+  let nextImageIndex = 0;
+  await runBoundedJobs(
+    CAPTURE_TIME_READERS,
+    () => (nextImageIndex < images.length && !signal.aborted ? nextImageIndex++ : undefined),
+    async (imageIndex) => {
+      const file = images[imageIndex].file;
+      captureTimes[imageIndex] = file && isJpegFile(file) ? await readCachedCaptureTime(file) : "";
+    },
+  );
+
+  const captureTimeById = new Map<string, string>();
+  images.forEach((image, imageIndex) => {
+    if (captureTimes[imageIndex] && captureTimes[imageIndex] !== image.captureTime) {
+      captureTimeById.set(image.id, captureTimes[imageIndex]);
+    }
+  });
+  return captureTimeById;
+}
+
+function groupNamesByType(items: DynamicChoices["species"]) {
+  const namesByType = new Map<ObservationType, string[]>();
+  for (const item of items) {
+    const names = namesByType.get(item.type);
+    if (names) {
+      names.push(item.name);
+    } else {
+      namesByType.set(item.type, [item.name]);
+    }
+  }
+  return namesByType;
+}
+
 function isTypingTarget(target: EventTarget | null) {
   return (
     target instanceof HTMLElement &&
@@ -174,11 +377,11 @@ function csvEscape(value: string) {
 }
 
 function makeCsv(records: AnnotationRecord[]) {
-  const header = ANNOTATION_COLUMNS.join(",");
   const rows = records.map((record) =>
     ANNOTATION_COLUMNS.map((column) => csvEscape(record[column] ?? "")).join(","),
   );
-  return [header, ...rows].join("\n");
+  rows.unshift(CSV_HEADER);
+  return rows.join("\n");
 }
 
 function compactFileName(fileName: string, maxLength = 36) {
@@ -192,6 +395,10 @@ function compactFileName(fileName: string, maxLength = 36) {
   return `${baseName.slice(0, maxLength - extension.length - 3)}...${extension}`;
 }
 
+function compactRangeLabel(startName: string, endName: string) {
+  return `${compactFileName(startName)} to ${compactFileName(endName)}`;
+}
+
 function getMissingFields(draft: AnnotationDraft) {
   const requiredFields: Array<[string, string]> = [
     ["Camera Location", draft.site],
@@ -220,6 +427,29 @@ function recordToDraft(record: AnnotationRecord): AnnotationDraft {
   };
 }
 
+function collectReviewedNames(
+  records: AnnotationRecord[],
+  images: LocalImage[],
+  imageIndexByName: Map<string, number>,
+) {
+  const names = new Set<string>();
+  for (const anno of records) {
+    const startIndex = imageIndexByName.get(anno["Start Filename"]);
+    const endIndex = imageIndexByName.get(anno["End Filename"]);
+    if (startIndex !== undefined && endIndex !== undefined) {
+      const rangeStart = Math.min(startIndex, endIndex);
+      const rangeEnd = Math.max(startIndex, endIndex);
+      for (let i = rangeStart; i <= rangeEnd; i++) {
+        names.add(images[i].name);
+      }
+    } else {
+      names.add(anno["Start Filename"]);
+      names.add(anno["End Filename"]);
+    }
+  }
+  return names;
+}
+
 function dbRecordToAnnotationRecord(dbRecord: any): AnnotationRecord {
   return {
     "Start Filename": dbRecord.start_filename,
@@ -230,22 +460,57 @@ function dbRecordToAnnotationRecord(dbRecord: any): AnnotationRecord {
     Type: dbRecord.type as ObservationType,
     Species: dbRecord.species,
     Behavior: dbRecord.behavior,
-    "Sequence Start Time": dbRecord.sequence_start_time || undefined,
-    "Sequence End Time": dbRecord.sequence_end_time || undefined,
+    "Sequence Start Time": dbRecord.sequence_start_time ?? "",
+    "Sequence End Time": dbRecord.sequence_end_time ?? "",
     "Is Single Image": String(dbRecord.is_single_image),
     "Reviewer Name": dbRecord.reviewer_name,
-    Notes: dbRecord.notes || undefined,
+    Notes: dbRecord.notes ?? "",
   };
 }
 
+const GridThumbnail = memo(function GridThumbnail({
+  name,
+  src,
+  imageIndex,
+  isCurrent,
+  badge,
+  onSelect,
+}: {
+  name: string;
+  src: string;
+  imageIndex: number;
+  isCurrent: boolean;
+  badge: ThumbnailBadge | null;
+  onSelect: (imageIndex: number) => void;
+}) {
+  return (
+    <button
+      className={`thumbnail ${isCurrent ? "current" : ""}`}
+      type="button"
+      onClick={() => onSelect(imageIndex)}
+      title={name}
+      aria-label={`Open ${name}`}
+    >
+      <img src={src} alt="" loading="lazy" decoding="async" />
+      <span className="thumbnail-index">{imageIndex + 1}</span>
+      {badge ? (
+        <span className={`thumbnail-badge ${badge}`}>{thumbnailBadgeIcons[badge]}</span>
+      ) : null}
+    </button>
+  );
+});
+
 export function AnnotationWorkspace({ onOpenDashboard }: { onOpenDashboard?: () => void }) {
   const [images, setImages] = useState<LocalImage[]>([]);
   const [currentIndex, setCurrentIndex] = useState(0);
-  const [markedStartIndex, setMarkedStartIndex] = useState<number | null>(null);
-  const [markedEndIndex, setMarkedEndIndex] = useState<number | null>(null);
-  const [sequenceStartTime, setSequenceStartTime] = useState("");
-  const [sequenceEndTime, setSequenceEndTime] = useState("");
-  const [isSingleImage, setIsSingleImage] = useState(false);
+  const [marks, setMarks] = useState<SequenceMarks>(emptyMarks);
+  const {
+    startIndex: markedStartIndex,
+    endIndex: markedEndIndex,
+    startTime: sequenceStartTime,
+    endTime: sequenceEndTime,
+    isSingleImage,
+  } = marks;
   const [draft, setDraft] = useState<AnnotationDraft>(() =>
     readStoredJson(DRAFT_STORAGE_KEY, createDefaultDraft()),
   );
@@ -254,52 +519,32 @@ export function AnnotationWorkspace({ onOpenDashboard }: { onOpenDashboard?: ()
   );
   const [dbAnnotations, setDbAnnotations] = useState<AnnotationRecord[]>([]);
 
-  // Compute reviewed image names reactively from both local and DB annotations
-  const reviewedNames = useMemo(() => {
-    const names = new Set<string>();
-
-    for (const anno of annotations) {
-      const startIndex = images.findIndex((img) => img.name === anno["Start Filename"]);
-      const endIndex = images.findIndex((img) => img.name === anno["End Filename"]);
-      if (startIndex >= 0 && endIndex >= 0) {
-        const rangeStart = Math.min(startIndex, endIndex);
-        const rangeEnd = Math.max(startIndex, endIndex);
-        for (let i = rangeStart; i <= rangeEnd; i++) {
-          if (images[i]) {
-            names.add(images[i].name);
-          }
-        }
-      } else {
-        names.add(anno["Start Filename"]);
-        names.add(anno["End Filename"]);
+  const imageIndexByName = useMemo(() => {
+    const indexByName = new Map<string, number>();
+    images.forEach((image, imageIndex) => {
+      if (!indexByName.has(image.name)) {
+        indexByName.set(image.name, imageIndex);
       }
-    }
-
-    for (const anno of dbAnnotations) {
-      const startIndex = images.findIndex((img) => img.name === anno["Start Filename"]);
-      const endIndex = images.findIndex((img) => img.name === anno["End Filename"]);
-      if (startIndex >= 0 && endIndex >= 0) {
-        const rangeStart = Math.min(startIndex, endIndex);
-        const rangeEnd = Math.max(startIndex, endIndex);
-        for (let i = rangeStart; i <= rangeEnd; i++) {
-          if (images[i]) {
-            names.add(images[i].name);
-          }
-        }
-      } else {
-        names.add(anno["Start Filename"]);
-        names.add(anno["End Filename"]);
-      }
-    }
+    });
+    return indexByName;
+  }, [images]);
 
-    return names;
-  }, [images, annotations, dbAnnotations]);
+  // Compute reviewed image names reactively from both local and DB annotations
+  const localReviewedNames = useMemo(
+    () => collectReviewedNames(annotations, images, imageIndexByName),
+    [annotations, images, imageIndexByName],
+  );
+  const dbReviewedNames = useMemo(
+    () => collectReviewedNames(dbAnnotations, images, imageIndexByName),
+    [dbAnnotations, images, imageIndexByName],
+  );
 
   const [assignmentsSheet, setAssignmentsSheet] = useState<SheetApiResponse>(emptySheetResponse);
   const [annotationsSheet, setAnnotationsSheet] = useState<SheetApiResponse>(emptySheetResponse);
   const [sheetMessage, setSheetMessage] = useState("");
   const [syncStatus, setSyncStatus] = useState<SyncStatus>("idle");
   const [syncMessage, setSyncMessage] = useState("");
+  const [isSyncing, setIsSyncing] = useState(false);
   const [isFullscreen, setIsFullscreen] = useState(false);
   const [installPrompt, setInstallPrompt] = useState<BeforeInstallPromptEvent | null>(null);
   const [editingAnnotationIndex, setEditingAnnotationIndex] = useState<number | null>(null);
@@ -307,7 +552,11 @@ export function AnnotationWorkspace({ onOpenDashboard }: { onOpenDashboard?: ()
   const [synologyLimit, setSynologyLimit] = useState(300);
   const [isLoadingSynology, setIsLoadingSynology] = useState(false);
   const [choices, setChoices] = useState<DynamicChoices>(fallbackChoices);
+  const [thumbnailUrls, setThumbnailUrls] = useState<Map<string, string>>(() => new Map());
   const objectUrlsRef = useRef<string[]>([]);
+  const thumbnailBatchRef = useRef(createThumbnailBatch());
+  const captureTimeAbortRef = useRef<AbortController | null>(null);
+  const isSyncingRef = useRef(false);
 
   // Fetch choices from Supabase on mount
   useEffect(() => {
@@ -328,20 +577,14 @@ export function AnnotationWorkspace({ onOpenDashboard }: { onOpenDashboard?: ()
         ]);
 
         const nextChoices: DynamicChoices = {
-          cameras: camerasData && camerasData.length ? camerasData.map((c) => c.name) : Array.from(CAMERAS),
-          locations: locationsData && locationsData.length ? locationsData.map((l) => l.name) : Array.from(SITE_LOCATIONS),
+          cameras: camerasData && camerasData.length ? camerasData.map((c) => c.name) : fallbackChoices.cameras,
+          locations: locationsData && locationsData.length ? locationsData.map((l) => l.name) : fallbackChoices.locations,
           species: speciesData && speciesData.length
             ? speciesData.map((s) => ({ name: s.name, type: s.type as ObservationType }))
-            : [
-                ...SEABIRD_SPECIES.map((s) => ({ name: s, type: "Seabird" as const })),
-                ...PREDATOR_SPECIES.map((s) => ({ name: s, type: "Predator" as const })),
-              ],
+            : fallbackChoices.species,
           behaviors: behaviorsData && behaviorsData.length
             ? behaviorsData.map((b) => ({ name: b.name, type: b.type as ObservationType }))
-            : [
-                ...SEABIRD_BEHAVIORS.map((b) => ({ name: b, type: "Seabird" as const })),
-                ...PREDATOR_BEHAVIORS.map((b) => ({ name: b, type: "Predator" as const })),
-              ],
+            : fallbackChoices.behaviors,
           templates: [],
           teamMembers: teamData && teamData.length ? teamData.map((t) => t.name) : [],
         };
@@ -442,17 +685,10 @@ export function AnnotationWorkspace({ onOpenDashboard }: { onOpenDashboard?: ()
 
 
   const currentImage = images[currentIndex] ?? null;
-  const speciesChoices = useMemo(() => {
-    return choices.species
-      .filter((s) => s.type === draft.type)
-      .map((s) => s.name);
-  }, [choices.species, draft.type]);
-
-  const behaviorChoices = useMemo(() => {
-    return choices.behaviors
-      .filter((b) => b.type === draft.type)
-      .map((b) => b.name);
-  }, [choices.behaviors, draft.type]);
+  const speciesByType = useMemo(() => groupNamesByType(choices.species), [choices.species]);
+  const behaviorsByType = useMemo(() => groupNamesByType(choices.behaviors), [choices.behaviors]);
+  const speciesChoices = speciesByType.get(draft.type) ?? noChoices;
+  const behaviorChoices = behaviorsByType.get(draft.type) ?? noChoices;
 
   const missingFields = useMemo(() => getMissingFields(draft), [draft]);
   const hasMarkedRange = markedStartIndex !== null && markedEndIndex !== null;
@@ -460,18 +696,19 @@ export function AnnotationWorkspace({ onOpenDashboard }: { onOpenDashboard?: ()
   const editingAnnotation = editingAnnotationIndex === null ? null : annotations[editingAnnotationIndex];
   const canSubmitAnnotation = editingAnnotation ? missingFields.length === 0 : canSave;
 
-  const reviewerChoices = useMemo(() => {
-    if (choices.teamMembers && choices.teamMembers.length > 0) {
-      return choices.teamMembers;
+  const assignmentReviewers = useMemo(() => {
+    const names = new Set<string>();
+    for (const row of assignmentsSheet.rows) {
+      const name = (row.Reviewer || row["Reviewer Name"] || "").trim();
+      if (name) {
+        names.add(name);
+      }
     }
-    const names = assignmentsSheet.rows
-      .map((row) => row.Reviewer || row["Reviewer Name"] || "")
-      .filter((name) => name.trim().length > 0);
-    return Array.from(new Set(names)).sort((firstName, secondName) =>
-      firstName.localeCompare(secondName),
-    );
+    return Array.from(names).sort(compareNames);
   }, [assignmentsSheet.rows]);
 
+  const reviewerChoices = choices.teamMembers.length > 0 ? choices.teamMembers : assignmentReviewers;
+
   const visibleImages = useMemo(() => {
     const halfWindow = Math.floor(THUMBNAIL_WINDOW_SIZE / 2);
     const firstIndex = Math.max(0, currentIndex - halfWindow);
@@ -484,66 +721,152 @@ export function AnnotationWorkspace({ onOpenDashboard }: { onOpenDashboard?: ()
     }));
   }, [currentIndex, images]);
 
+  // Replacing the images starts a new batch, so the batch object doubles as
+  // the token that tells a late thumbnail it belongs to an old folder.
+  const runThumbnailJobs = useCallback(async (batch: ThumbnailBatch) => {
+    const isReplaced = () => thumbnailBatchRef.current !== batch;
+    const flushThumbnails = () => {
+      if (batch.flushTimer !== null) {
+        window.clearTimeout(batch.flushTimer);
+        batch.flushTimer = null;
+      }
+      if (isReplaced() || !batch.finished.size) {
+        return;
+      }
+      const finished = batch.finished;
+      batch.finished = new Map();
+      setThumbnailUrls((previousUrls) => new Map([...previousUrls, ...finished]));
+    };
+
+    batch.isRunning = true;
+    while (!isReplaced() && batch.nextJob < batch.queue.length) {
+      await runBoundedJobs(
+        THUMBNAIL_WORKERS,
+        () => (!isReplaced() && batch.nextJob < batch.queue.length ? batch.queue[batch.nextJob++] : undefined),
+        async ({ id, file }) => {
+          const thumbnailUrl = await createThumbnailUrl(file);
+          if (!thumbnailUrl) {
+            return;
+          }
+          if (isReplaced()) {
+            URL.revokeObjectURL(thumbnailUrl);
+            return;
+          }
+
+          objectUrlsRef.current.push(thumbnailUrl);
+          batch.finished.set(id, thumbnailUrl);
+          batch.flushTimer ??= window.setTimeout(flushThumbnails, THUMBNAIL_FLUSH_MS);
+        },
+      );
+    }
+    batch.isRunning = false;
+    flushThumbnails();
+  }, []);
+
+  useEffect(() => {
+    const batch = thumbnailBatchRef.current;
+    visibleImages.forEach(({ image }) => {
+      if (image.file && !batch.requested.has(image.id)) {
+        batch.requested.add(image.id);
+        batch.queue.push({ id: image.id, file: image.file });
+      }
+    });
+    if (!batch.isRunning) {
+      void runThumbnailJobs(batch);
+    }
+  }, [runThumbnailJobs, visibleImages]);
+
+  const markedStartName = markedStartIndex === null ? undefined : images[markedStartIndex]?.name;
+  const markedEndName = markedEndIndex === null ? undefined : images[markedEndIndex]?.name;
   const selectedRangeLabel = useMemo(() => {
     if (markedStartIndex === null || markedEndIndex === null) {
-      if (editingAnnotation) {
-        return `${compactFileName(editingAnnotation["Start Filename"])} to ${compactFileName(
-          editingAnnotation["End Filename"],
-        )}`;
-      }
-      return "No range selected";
+      return editingAnnotation
+        ? compactRangeLabel(editingAnnotation["Start Filename"], editingAnnotation["End Filename"])
+        : "No range selected";
     }
 
     if (markedStartIndex === markedEndIndex) {
-      return compactFileName(images[markedStartIndex]?.name ?? "Single image");
+      return compactFileName(markedStartName ?? "Single image");
     }
 
-    return `${compactFileName(images[markedStartIndex]?.name ?? "Start")} to ${compactFileName(
-      images[markedEndIndex]?.name ?? "End",
-    )}`;
-  }, [editingAnnotation, images, markedEndIndex, markedStartIndex]);
+    return compactRangeLabel(markedStartName ?? "Start", markedEndName ?? "End");
+  }, [editingAnnotation, markedEndIndex, markedEndName, markedStartIndex, markedStartName]);
 
-  const recentAnnotations = useMemo(
-    () => annotations.map((annotation, annotationIndex) => ({ annotation, annotationIndex })).slice(-8).reverse(),
-    [annotations],
-  );
+  const recentAnnotations = useMemo(() => {
+    const firstIndex = Math.max(0, annotations.length - RECENT_ANNOTATION_COUNT);
+    return annotations
+      .slice(firstIndex)
+      .map((annotation, offset) => ({ annotation, annotationIndex: firstIndex + offset }))
+      .reverse();
+  }, [annotations]);
 
   const clearObjectUrls = useCallback(() => {
     objectUrlsRef.current.forEach((objectUrl) => URL.revokeObjectURL(objectUrl));
     objectUrlsRef.current = [];
+    thumbnailBatchRef.current = createThumbnailBatch();
+    setThumbnailUrls(new Map());
+    captureTimeAbortRef.current?.abort();
+    captureTimeAbortRef.current = null;
   }, []);
 
   const resetMarks = useCallback(() => {
-    setMarkedStartIndex(null);
-    setMarkedEndIndex(null);
-    setSequenceStartTime("");
-    setSequenceEndTime("");
-    setIsSingleImage(false);
+    setMarks(emptyMarks);
+  }, []);
+
+  const updateMarks = useCallback((patch: Partial<SequenceMarks>) => {
+    setMarks((previousMarks) => ({ ...previousMarks, ...patch }));
   }, []);
 
   const replaceImages = useCallback(
     (files: File[]) => {
       clearObjectUrls();
-      const nextImages = files
-        .filter(isImageFile)
-        .sort((firstFile, secondFile) => firstFile.name.localeCompare(secondFile.name))
-        .map((file, fileIndex) => {
-          const objectUrl = URL.createObjectURL(file);
-          objectUrlsRef.current.push(objectUrl);
-          return {
-            id: `${file.name}-${file.size}-${file.lastModified}-${fileIndex}`,
-            name: file.name,
-            url: objectUrl,
-            size: file.size,
-            captureTime: formatDateTime(file.lastModified),
-            lastModified: file.lastModified,
-            source: "local" as const,
-          };
-        });
+      const nextImages = sortFilesByName(files.filter(isImageFile)).map((file, fileIndex) => {
+        const objectUrl = URL.createObjectURL(file);
+        objectUrlsRef.current.push(objectUrl);
+        return {
+          id: `${file.name}-${file.size}-${file.lastModified}-${fileIndex}`,
+          name: file.name,
+          url: objectUrl,
+          file,
+          size: file.size,
+          captureTime: formatDateTime(file.lastModified),
+          lastModified: file.lastModified,
+          source: "local" as const,
+        };
+      });
 
       setImages(nextImages);
       setCurrentIndex(0);
       resetMarks();
+
+      const abortController = new AbortController();
+      captureTimeAbortRef.current = abortController;
+      void readCaptureTimes(nextImages, abortController.signal).then((captureTimeById) => {
+        if (abortController.signal.aborted || captureTimeById.size === 0) {
+          return;
+        }
+
+        setImages((previousImages) =>
+          previousImages.map((image) => {
+            const captureTime = captureTimeById.get(image.id);
+            return captureTime ? { ...image, captureTime } : image;
+          }),
+        );
+        // Marks made before the read finished still hold the file time.
+        const resolveMarkTime = (imageIndex: number | null, markTime: string) => {
+          const image = imageIndex === null ? undefined : nextImages[imageIndex];
+          return image && markTime === image.captureTime
+            ? captureTimeById.get(image.id) ?? markTime
+            : markTime;
+        };
+        setMarks((previousMarks) => {
+          const startTime = resolveMarkTime(previousMarks.startIndex, previousMarks.startTime);
+          const endTime = resolveMarkTime(previousMarks.endIndex, previousMarks.endTime);
+          return startTime === previousMarks.startTime && endTime === previousMarks.endTime
+            ? previousMarks
+            : { ...previousMarks, startTime, endTime };
+        });
+      });
     },
     [clearObjectUrls, resetMarks],
   );
@@ -557,55 +880,52 @@ export function AnnotationWorkspace({ onOpenDashboard }: { onOpenDashboard?: ()
   }, [images.length]);
 
   const markStart = useCallback(() => {
-    if (!currentImage || isSingleImage) {
+    if (!currentImage) {
       return;
     }
 
-    setMarkedStartIndex((previousIndex) => {
-      if (previousIndex === currentIndex) {
-        setSequenceStartTime("");
-        return null;
+    setMarks((previousMarks) => {
+      if (previousMarks.isSingleImage) {
+        return previousMarks;
       }
-
-      setSequenceStartTime(currentImage.captureTime);
-      return currentIndex;
+      return previousMarks.startIndex === currentIndex
+        ? { ...previousMarks, startIndex: null, startTime: "" }
+        : { ...previousMarks, startIndex: currentIndex, startTime: currentImage.captureTime };
     });
-  }, [currentImage, currentIndex, isSingleImage]);
+  }, [currentImage, currentIndex]);
 
   const markEnd = useCallback(() => {
-    if (!currentImage || isSingleImage) {
+    if (!currentImage) {
       return;
     }
 
-    setMarkedEndIndex((previousIndex) => {
-      if (previousIndex === currentIndex) {
-        setSequenceEndTime("");
-        return null;
+    setMarks((previousMarks) => {
+      if (previousMarks.isSingleImage) {
+        return previousMarks;
       }
-
-      setSequenceEndTime(currentImage.captureTime);
-      return currentIndex;
+      return previousMarks.endIndex === currentIndex
+        ? { ...previousMarks, endIndex: null, endTime: "" }
+        : { ...previousMarks, endIndex: currentIndex, endTime: currentImage.captureTime };
     });
-  }, [currentImage, currentIndex, isSingleImage]);
+  }, [currentImage, currentIndex]);
 
   const toggleSingleImage = useCallback(() => {
     if (!currentImage) {
       return;
     }
 
-    setIsSingleImage((previousValue) => {
-      const nextValue = !previousValue;
-      if (nextValue) {
-        setMarkedStartIndex(currentIndex);
-        setMarkedEndIndex(currentIndex);
-        setSequenceStartTime(currentImage.captureTime);
-        setSequenceEndTime(currentImage.captureTime);
-      } else {
-        resetMarks();
-      }
-      return nextValue;
-    });
-  }, [currentImage, currentIndex, resetMarks]);
+    setMarks((previousMarks) =>
+      previousMarks.isSingleImage
+        ? emptyMarks
+        : {
+            startIndex: currentIndex,
+            endIndex: currentIndex,
+            startTime: currentImage.captureTime,
+            endTime: currentImage.captureTime,
+            isSingleImage: true,
+          },
+    );
+  }, [currentImage, currentIndex]);
 
   const handleFilesSelected = useCallback(
     (fileList: FileList | File[]) => {
@@ -644,6 +964,7 @@ export function AnnotationWorkspace({ onOpenDashboard }: { onOpenDashboard?: ()
           id: `synology-${image.path}-${imageIndex}`,
           name: image.name,
           url: image.url,
+          thumbnailUrl: image.thumbnailUrl,
           size: image.size,
           captureTime: image.captureTime,
           lastModified: 0,
@@ -667,7 +988,11 @@ export function AnnotationWorkspace({ onOpenDashboard }: { onOpenDashboard?: ()
   }, [clearObjectUrls, resetMarks, synologyFolder, synologyLimit]);
 
   const updateDraft = useCallback((patch: Partial<AnnotationDraft>) => {
-    setDraft((previousDraft) => ({ ...previousDraft, ...patch }));
+    setDraft((previousDraft) =>
+      (Object.keys(patch) as Array<keyof AnnotationDraft>).every((field) => previousDraft[field] === patch[field])
+        ? previousDraft
+        : { ...previousDraft, ...patch },
+    );
   }, []);
 
   const handleTypeChange = useCallback(
@@ -696,7 +1021,7 @@ export function AnnotationWorkspace({ onOpenDashboard }: { onOpenDashboard?: ()
   );
 
   const saveAnnotation = useCallback(() => {
-    const currentEditingRecord = editingAnnotationIndex === null ? null : annotations[editingAnnotationIndex];
+    const currentEditingRecord = editingAnnotation;
     const requiresMarkedImages = !currentEditingRecord;
 
     if (
@@ -734,20 +1059,21 @@ export function AnnotationWorkspace({ onOpenDashboard }: { onOpenDashboard?: ()
       return;
     }
 
+    const { site, camera, retrievalDate, type, species, behavior, reviewerName, notes } = draft;
     const record: AnnotationRecord = {
       "Start Filename": startFilename,
       "End Filename": endFilename,
-      Site: draft.site,
-      Camera: draft.camera,
-      "Retrieval Date": draft.retrievalDate,
-      Type: draft.type,
-      Species: draft.species,
-      Behavior: draft.behavior,
+      Site: site,
+      Camera: camera,
+      "Retrieval Date": retrievalDate,
+      Type: type,
+      Species: species,
+      Behavior: behavior,
       "Sequence Start Time": sequenceStartTime || currentEditingRecord?.["Sequence Start Time"] || "",
       "Sequence End Time": sequenceEndTime || currentEditingRecord?.["Sequence End Time"] || "",
       "Is Single Image": String(isSingleImage),
-      "Reviewer Name": draft.reviewerName,
-      Notes: draft.notes,
+      "Reviewer Name": reviewerName,
+      Notes: notes,
     };
 
     setAnnotations((previousAnnotations) => {
@@ -768,9 +1094,9 @@ export function AnnotationWorkspace({ onOpenDashboard }: { onOpenDashboard?: ()
       setCurrentIndex((previousIndex) => Math.min(images.length - 1, markedEndIndex + 1 || previousIndex));
     }
   }, [
-    annotations,
     canSubmitAnnotation,
     draft,
+    editingAnnotation,
     editingAnnotationIndex,
     images,
     isSingleImage,
@@ -785,23 +1111,29 @@ export function AnnotationWorkspace({ onOpenDashboard }: { onOpenDashboard?: ()
 
   const beginEditAnnotation = useCallback(
     (annotation: AnnotationRecord, annotationIndex: number) => {
+      if (isSyncingRef.current) {
+        return;
+      }
+
       setEditingAnnotationIndex(annotationIndex);
       setDraft(recordToDraft(annotation));
-      setSequenceStartTime(annotation["Sequence Start Time"]);
-      setSequenceEndTime(annotation["Sequence End Time"]);
-      setIsSingleImage(annotation["Is Single Image"] === "true");
-
-      const startIndex = images.findIndex((image) => image.name === annotation["Start Filename"]);
-      const endIndex = images.findIndex((image) => image.name === annotation["End Filename"]);
-      setMarkedStartIndex(startIndex >= 0 ? startIndex : null);
-      setMarkedEndIndex(endIndex >= 0 ? endIndex : null);
-      if (startIndex >= 0) {
+
+      const startIndex = imageIndexByName.get(annotation["Start Filename"]) ?? null;
+      const endIndex = imageIndexByName.get(annotation["End Filename"]) ?? null;
+      setMarks({
+        startIndex,
+        endIndex,
+        startTime: annotation["Sequence Start Time"],
+        endTime: annotation["Sequence End Time"],
+        isSingleImage: annotation["Is Single Image"] === "true",
+      });
+      if (startIndex !== null) {
         setCurrentIndex(startIndex);
       }
       setSyncStatus("idle");
       setSyncMessage("Editing local annotation.");
     },
-    [images],
+    [imageIndexByName],
   );
 
   const cancelEditAnnotation = useCallback(() => {
@@ -814,6 +1146,10 @@ export function AnnotationWorkspace({ onOpenDashboard }: { onOpenDashboard?: ()
 
   const deleteAnnotation = useCallback(
     (annotationIndex: number) => {
+      if (isSyncingRef.current) {
+        return;
+      }
+
       setAnnotations((previousAnnotations) =>
         previousAnnotations.filter((_, candidateIndex) => candidateIndex !== annotationIndex),
       );
@@ -827,6 +1163,45 @@ export function AnnotationWorkspace({ onOpenDashboard }: { onOpenDashboard?: ()
     [editingAnnotationIndex, resetMarks],
   );
 
+  const recentAnnotationRows = useMemo(
+    () =>
+      recentAnnotations.map(({ annotation, annotationIndex }) => (
+        <tr key={`${annotation["Start Filename"]}-${annotationIndex}`}>
+          <td>{annotation["Is Single Image"] === "true" ? "Single" : annotation.Type}</td>
+          <td>{compactFileName(annotation["Start Filename"], 28)}</td>
+          <td>{compactFileName(annotation["End Filename"], 28)}</td>
+          <td>{annotation.Species}</td>
+          <td>{annotation.Behavior}</td>
+          <td>{annotation["Reviewer Name"]}</td>
+          <td>
+            <div className="row-actions">
+              <button
+                className="icon-button"
+                type="button"
+                onClick={() => beginEditAnnotation(annotation, annotationIndex)}
+                disabled={isSyncing}
+                aria-label="Edit annotation"
+                title="Edit annotation"
+              >
+                <EditIcon />
+              </button>
+              <button
+                className="icon-button danger"
+                type="button"
+                onClick={() => deleteAnnotation(annotationIndex)}
+                disabled={isSyncing}
+                aria-label="Delete annotation"
+                title="Delete annotation"
+              >
+                <TrashIcon />
+              </button>
+            </div>
+          </td>
+        </tr>
+      )),
+    [beginEditAnnotation, deleteAnnotation, isSyncing, recentAnnotations],
+  );
+
   const undoLastAnnotation = useCallback(() => {
     if (!annotations.length) {
       return;
@@ -835,10 +1210,18 @@ export function AnnotationWorkspace({ onOpenDashboard }: { onOpenDashboard?: ()
   }, [annotations.length, deleteAnnotation]);
 
   const syncAnnotations = useCallback(async () => {
-    if (!annotations.length) {
+    if (!annotations.length || isSyncingRef.current) {
+      return;
+    }
+    if (editingAnnotationIndex !== null) {
+      setSyncStatus("error");
+      setSyncMessage("Finish or cancel the annotation edit before syncing.");
       return;
     }
 
+    // Set before any await so a second click cannot insert the rows twice.
+    isSyncingRef.current = true;
+    setIsSyncing(true);
     setSyncStatus("syncing");
     setSyncMessage("Syncing annotations to Supabase...");
 
@@ -864,15 +1247,20 @@ export function AnnotationWorkspace({ onOpenDashboard }: { onOpenDashboard?: ()
         throw error;
       }
 
-      setAnnotations([]);
-      setEditingAnnotationIndex(null);
+      // Sent rows are locked while the insert runs, so they are still the
+      // first rows; anything after them was saved during the sync.
+      const sentCount = annotations.length;
+      setAnnotations((previousAnnotations) => previousAnnotations.slice(sentCount));
       setSyncStatus("success");
       setSyncMessage(`Successfully synced ${annotations.length} rows to Supabase.`);
     } catch (error) {
       setSyncStatus("error");
       setSyncMessage(error instanceof Error ? error.message : "Supabase sync failed.");
+    } finally {
+      isSyncingRef.current = false;
+      setIsSyncing(false);
     }
-  }, [annotations]);
+  }, [annotations, editingAnnotationIndex]);
 
   const resetForm = useCallback(() => {
     resetMarks();
@@ -901,12 +1289,17 @@ export function AnnotationWorkspace({ onOpenDashboard }: { onOpenDashboard?: ()
   }, [annotations]);
 
   const clearLocalSession = useCallback(() => {
+    if (isSyncingRef.current) {
+      return;
+    }
+
     const confirmed = window.confirm("Clear local images, marks, and unsynced annotations?");
     if (!confirmed) {
       return;
     }
 
     clearObjectUrls();
+    captureTimeCache.clear();
     setImages([]);
     setCurrentIndex(0);
     setAnnotations([]);
@@ -932,7 +1325,10 @@ export function AnnotationWorkspace({ onOpenDashboard }: { onOpenDashboard?: ()
   }, [draft]);
 
   useEffect(() => {
-    writeStoredJson(ANNOTATIONS_STORAGE_KEY, annotations);
+    if (!writeStoredJson(ANNOTATIONS_STORAGE_KEY, annotations)) {
+      setSyncStatus("error");
+      setSyncMessage("Annotations could not be saved in this browser. Sync or export them before closing the tab.");
+    }
   }, [annotations]);
 
 
@@ -949,26 +1345,19 @@ export function AnnotationWorkspace({ onOpenDashboard }: { onOpenDashboard?: ()
   useEffect(() => {
     const abortController = new AbortController();
 
-    async function loadSheets() {
+    async function loadSheet(url: string, applySheet: (sheet: SheetApiResponse) => void) {
       try {
-        const [assignmentsResponse, annotationsResponse] = await Promise.all([
-          fetch("/api/sheets/assignments", { signal: abortController.signal }),
-          fetch("/api/sheets/annotations", { signal: abortController.signal }),
-        ]);
-        const [nextAssignmentsSheet, nextAnnotationsSheet] = await Promise.all([
-          assignmentsResponse.json() as Promise<SheetApiResponse>,
-          annotationsResponse.json() as Promise<SheetApiResponse>,
-        ]);
+        const response = await fetch(url, { signal: abortController.signal });
+        const sheet = (await response.json()) as SheetApiResponse;
 
         if (abortController.signal.aborted) {
           return;
         }
 
-        setAssignmentsSheet(nextAssignmentsSheet);
-        setAnnotationsSheet(nextAnnotationsSheet);
-        setSheetMessage(
-          nextAssignmentsSheet.message || nextAnnotationsSheet.message || "",
-        );
+        applySheet(sheet);
+        if (sheet.message) {
+          setSheetMessage(sheet.message);
+        }
       } catch (error) {
         if (!abortController.signal.aborted) {
           setSheetMessage(
@@ -978,39 +1367,47 @@ export function AnnotationWorkspace({ onOpenDashboard }: { onOpenDashboard?: ()
       }
     }
 
-    loadSheets();
+    void loadSheet("/api/sheets/assignments", setAssignmentsSheet);
+    void loadSheet("/api/sheets/annotations", setAnnotationsSheet);
     return () => abortController.abort();
   }, []);
 
   useEffect(() => clearObjectUrls, [clearObjectUrls]);
 
+  // Read through a ref so one keydown listener stays registered.
+  const shortcutActionsRef = useRef({ goToNextImage, goToPreviousImage, markEnd, markStart, toggleSingleImage });
+  useEffect(() => {
+    shortcutActionsRef.current = { goToNextImage, goToPreviousImage, markEnd, markStart, toggleSingleImage };
+  }, [goToNextImage, goToPreviousImage, markEnd, markStart, toggleSingleImage]);
+
   useEffect(() => {
     const handleKeyDown = (event: KeyboardEvent) => {
       if (isTypingTarget(event.target)) {
         return;
       }
 
+      const actions = shortcutActionsRef.current;
       if (event.key === "ArrowLeft") {
         event.preventDefault();
-        goToPreviousImage();
+        actions.goToPreviousImage();
       } else if (event.key === "ArrowRight") {
         event.preventDefault();
-        goToNextImage();
+        actions.goToNextImage();
       } else if (event.key.toLowerCase() === "s") {
         event.preventDefault();
-        markStart();
+        actions.markStart();
       } else if (event.key.toLowerCase() === "e") {
         event.preventDefault();
-        markEnd();
+        actions.markEnd();
       } else if (event.key.toLowerCase() === "i") {
         event.preventDefault();
-        toggleSingleImage();
+        actions.toggleSingleImage();
       }
     };
 
     window.addEventListener("keydown", handleKeyDown);
     return () => window.removeEventListener("keydown", handleKeyDown);
-  }, [goToNextImage, goToPreviousImage, markEnd, markStart, toggleSingleImage]);
+  }, []);
 
   return (
     <>
@@ -1051,7 +1448,7 @@ export function AnnotationWorkspace({ onOpenDashboard }: { onOpenDashboard?: ()
               className="button button-primary"
               type="button"
               onClick={syncAnnotations}
-              disabled={!annotations.length || syncStatus === "syncing"}
+              disabled={!annotations.length || isSyncing || editingAnnotationIndex !== null}
             >
               <SyncIcon />
               {syncStatus === "syncing" ? "Syncing" : "Sync"}
@@ -1244,31 +1641,25 @@ export function AnnotationWorkspace({ onOpenDashboard }: { onOpenDashboard?: ()
             </div>
 
             <div className="thumbnail-grid" aria-label="Loaded image thumbnails">
-              {visibleImages.map(({ image, imageIndex }) => {
-                const isCurrent = imageIndex === currentIndex;
-                const isStart = imageIndex === markedStartIndex;
-                const isEnd = imageIndex === markedEndIndex;
-                const isReviewed = reviewedNames.has(image.name);
-
-                return (
-                  <button
-                    className={`thumbnail ${isCurrent ? "current" : ""}`}
-                    key={image.id}
-                    type="button"
-                    onClick={() => setCurrentIndex(imageIndex)}
-                    title={image.name}
-                    aria-label={`Open ${image.name}`}
-                  >
-                    <img src={image.url} alt="" loading="lazy" decoding="async" />
-                    <span className="thumbnail-index">{imageIndex + 1}</span>
-                    {isStart || isEnd || isReviewed ? (
-                      <span className={`thumbnail-badge ${isStart ? "start" : isEnd ? "end" : "reviewed"}`}>
-                        {isStart ? <StartIcon size={14} /> : isEnd ? <EndIcon size={14} /> : <CheckIcon size={14} />}
-                      </span>
-                    ) : null}
-                  </button>
-                );
-              })}
+              {visibleImages.map(({ image, imageIndex }) => (
+                <GridThumbnail
+                  key={image.id}
+                  name={image.name}
+                  src={thumbnailUrls.get(image.id) ?? image.thumbnailUrl ?? image.url}
+                  imageIndex={imageIndex}
+                  isCurrent={imageIndex === currentIndex}
+                  badge={
+                    imageIndex === markedStartIndex
+                      ? "start"
+                      : imageIndex === markedEndIndex
+                        ? "end"
+                        : localReviewedNames.has(image.name) || dbReviewedNames.has(image.name)
+                          ? "reviewed"
+                          : null
+                  }
+                  onSelect={setCurrentIndex}
+                />
+              ))}
             </div>
           </section>
 
@@ -1279,8 +1670,7 @@ export function AnnotationWorkspace({ onOpenDashboard }: { onOpenDashboard?: ()
                 <h2>Details</h2>
               </div>
               <button
-                className="button button-secondary"
-                style={{ minHeight: "32px", height: "32px", fontSize: "0.82rem" }}
+                className="button button-secondary button-compact"
                 type="button"
                 onClick={resetForm}
                 title="Reset active form inputs"
@@ -1396,11 +1786,11 @@ export function AnnotationWorkspace({ onOpenDashboard }: { onOpenDashboard?: ()
               <div className="inline-fields">
                 <label>
                   Start time
-                  <input value={sequenceStartTime} onChange={(event) => setSequenceStartTime(event.currentTarget.value)} />
+                  <input value={sequenceStartTime} onChange={(event) => updateMarks({ startTime: event.currentTarget.value })} />
                 </label>
                 <label>
                   End time
-                  <input value={sequenceEndTime} onChange={(event) => setSequenceEndTime(event.currentTarget.value)} />
+                  <input value={sequenceEndTime} onChange={(event) => updateMarks({ endTime: event.currentTarget.value })} />
                 </label>
               </div>
 
@@ -1458,10 +1848,10 @@ export function AnnotationWorkspace({ onOpenDashboard }: { onOpenDashboard?: ()
             </div>
             <div className="section-actions">
               <button
-                className="button"
-                style={{ borderColor: "var(--coral)", color: "var(--coral)", background: "rgba(200, 95, 74, 0.04)" }}
+                className="button button-danger"
                 type="button"
                 onClick={clearLocalSession}
+                disabled={isSyncing}
                 title="Completely clear workspace session (double confirmation)"
               >
                 <TrashIcon />
@@ -1471,11 +1861,11 @@ export function AnnotationWorkspace({ onOpenDashboard }: { onOpenDashboard?: ()
                 <UploadIcon />
                 Export CSV
               </button>
-              <button className="button button-ghost" type="button" onClick={undoLastAnnotation} disabled={!annotations.length}>
+              <button className="button button-ghost" type="button" onClick={undoLastAnnotation} disabled={!annotations.length || isSyncing}>
                 <UndoIcon />
                 Undo last
               </button>
-              <button className="button button-primary" type="button" onClick={syncAnnotations} disabled={!annotations.length || syncStatus === "syncing"}>
+              <button className="button button-primary" type="button" onClick={syncAnnotations} disabled={!annotations.length || isSyncing || editingAnnotationIndex !== null}>
                 <SheetIcon />
                 Sync rows
               </button>
@@ -1484,56 +1874,9 @@ export function AnnotationWorkspace({ onOpenDashboard }: { onOpenDashboard?: ()
 
           <div className="table-wrap">
             <table>
-              <thead>
-                <tr>
-                  <th>Type</th>
-                  <th>Start</th>
-                  <th>End</th>
-                  <th>Species</th>
-                  <th>Behavior</th>
-                  <th>Reviewer</th>
-                  <th>Actions</th>
-                </tr>
-              </thead>
+              {annotationsTableHead}
               <tbody>
-                {recentAnnotations.length ? (
-                  recentAnnotations.map(({ annotation, annotationIndex }) => (
-                    <tr key={`${annotation["Start Filename"]}-${annotationIndex}`}>
-                      <td>{annotation["Is Single Image"] === "true" ? "Single" : annotation.Type}</td>
-                      <td>{compactFileName(annotation["Start Filename"], 28)}</td>
-                      <td>{compactFileName(annotation["End Filename"], 28)}</td>
-                      <td>{annotation.Species}</td>
-                      <td>{annotation.Behavior}</td>
-                      <td>{annotation["Reviewer Name"]}</td>
-                      <td>
-                        <div className="row-actions">
-                          <button
-                            className="icon-button"
-                            type="button"
-                            onClick={() => beginEditAnnotation(annotation, annotationIndex)}
-                            aria-label="Edit annotation"
-                            title="Edit annotation"
-                          >
-                            <EditIcon />
-                          </button>
-                          <button
-                            className="icon-button danger"
-                            type="button"
-                            onClick={() => deleteAnnotation(annotationIndex)}
-                            aria-label="Delete annotation"
-                            title="Delete annotation"
-                          >
-                            <TrashIcon />
-                          </button>
-                        </div>
-                      </td>
-                    </tr>
-                  ))
-                ) : (
-                  <tr>
-                    <td colSpan={7}>No local annotations saved yet.</td>
-                  </tr>
-                )}
+                {recentAnnotations.length ? recentAnnotationRows : emptyAnnotationsRow}
               </tbody>
             </table>
           </div>
@@ -1545,7 +1888,12 @@ export function AnnotationWorkspace({ onOpenDashboard }: { onOpenDashboard?: ()
           <button className="fullscreen-close" type="button" onClick={() => setIsFullscreen(false)}>
             Close
           </button>
-          <img src={currentImage.url} alt={currentImage.name} onClick={(event) => event.stopPropagation()} />
+          <img
+            src={currentImage.url}
+            alt={currentImage.name}
+            decoding="async"
+            onClick={(event) => event.stopPropagation()}
+          />
         </div>
       ) : null}
     </>
@@ -1,6 +1,6 @@
 "use client";
 
-import { useEffect, useState } from "react";
+import { useEffect, useRef, useState } from "react";
 import { supabase } from "@/lib/supabase";
 import { type AnnotationTemplate, type ObservationType, type DynamicChoices, fallbackChoices } from "@/lib/annotation-data";
 import { SyncIcon, TrashIcon } from "@/components/Icons";
@@ -17,6 +17,7 @@ export function ManagementDashboard({ onBack }: ManagementDashboardProps) {
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState("");
   const [actionMessage, setActionMessage] = useState("");
+  const feedbackTimeoutRef = useRef<ReturnType<typeof setTimeout> | null>(null);
 
   // Input states for Add forms
   const [newCamera, setNewCamera] = useState("");
@@ -89,12 +90,28 @@ export function ManagementDashboard({ onBack }: ManagementDashboardProps) {
     loadAllData();
   }, []);
 
-  // Helper to show brief success message
+  // Helper to show brief success message; a newer message replaces the
+  // pending timeout so an older one cannot clear it early.
   function showFeedback(msg: string) {
+    if (feedbackTimeoutRef.current) {
+      clearTimeout(feedbackTimeoutRef.current);
+    }
     setActionMessage(msg);
-    setTimeout(() => setActionMessage(""), 3500);
+    feedbackTimeoutRef.current = setTimeout(() => {
+      feedbackTimeoutRef.current = null;
+      setActionMessage("");
+    }, 3500);
   }
 
+  useEffect(
+    () => () => {
+      if (feedbackTimeoutRef.current) {
+        clearTimeout(feedbackTimeoutRef.current);
+      }
+    },
+    [],
+  );
+
   // --- Add actions ---
   async function handleAddCamera(e: React.FormEvent) {
     e.preventDefault();
@@ -148,8 +165,8 @@ export function ManagementDashboard({ onBack }: ManagementDashboardProps) {
         .map((line) => line.trim())
         .filter((line) => line.length > 0);
 
-      const uniqueItems = Array.from(new Set(items));
-      const newItems = uniqueItems.filter((item) => !choices.locations.includes(item));
+      const existingItems = new Set(choices.locations);
+      const newItems = Array.from(new Set(items)).filter((item) => !existingItems.has(item));
 
       if (newItems.length === 0) {
         alert("All entered Camera Locations are already present in the database.");
@@ -182,8 +199,8 @@ export function ManagementDashboard({ onBack }: ManagementDashboardProps) {
         .map((line) => line.trim())
         .filter((line) => line.length > 0);
 
-      const uniqueItems = Array.from(new Set(items));
-      const newItems = uniqueItems.filter((item) => !choices.cameras.includes(item));
+      const existingItems = new Set(choices.cameras);
+      const newItems = Array.from(new Set(items)).filter((item) => !existingItems.has(item));
 
       if (newItems.length === 0) {
         alert("All entered Camera Unit IDs are already present in the database.");
@@ -363,14 +380,14 @@ export function ManagementDashboard({ onBack }: ManagementDashboardProps) {
                       <thead>
                         <tr>
                           <th>Camera Unit ID</th>
-                          <th style={{ width: "80px", textAlign: "right" }}>Action</th>
+                          <th className="action-cell">Action</th>
                         </tr>
                       </thead>
                       <tbody>
                         {choices.cameras.map((cam) => (
                           <tr key={cam}>
                             <td><strong>{cam}</strong></td>
-                            <td style={{ textAlign: "right" }}>
+                            <td className="action-cell">
                               <button
                                 className="danger-text-button"
                                 onClick={() => handleDeleteItem("cameras", "name", cam)}
@@ -382,7 +399,7 @@ export function ManagementDashboard({ onBack }: ManagementDashboardProps) {
                         ))}
                         {choices.cameras.length === 0 && (
                           <tr>
-                            <td colSpan={2} style={{ color: "var(--muted)" }}>No custom camera unit IDs. Click Add to create one.</td>
+                            <td colSpan={2} className="empty-cell">No custom camera unit IDs. Click Add to create one.</td>
                           </tr>
                         )}
                       </tbody>
@@ -398,14 +415,14 @@ export function ManagementDashboard({ onBack }: ManagementDashboardProps) {
                       <thead>
                         <tr>
                           <th>Camera Location</th>
-                          <th style={{ width: "80px", textAlign: "right" }}>Action</th>
+                          <th className="action-cell">Action</th>
                         </tr>
                       </thead>
                       <tbody>
                         {choices.locations.map((loc) => (
                           <tr key={loc}>
                             <td><strong>{loc}</strong></td>
-                            <td style={{ textAlign: "right" }}>
+                            <td className="action-cell">
                               <button
                                 className="danger-text-button"
                                 onClick={() => handleDeleteItem("site_locations", "name", loc)}
@@ -417,7 +434,7 @@ export function ManagementDashboard({ onBack }: ManagementDashboardProps) {
                         ))}
                         {choices.locations.length === 0 && (
                           <tr>
-                            <td colSpan={2} style={{ color: "var(--muted)" }}>No custom camera locations.</td>
+                            <td colSpan={2} className="empty-cell">No custom camera locations.</td>
                           </tr>
                         )}
                       </tbody>
@@ -433,14 +450,14 @@ export function ManagementDashboard({ onBack }: ManagementDashboardProps) {
                       <thead>
                         <tr>
                           <th>Reviewer Name</th>
-                          <th style={{ width: "80px", textAlign: "right" }}>Action</th>
+                          <th className="action-cell">Action</th>
                         </tr>
                       </thead>
                       <tbody>
                         {choices.teamMembers.map((member) => (
                           <tr key={member}>
                             <td><strong>{member}</strong></td>
-                            <td style={{ textAlign: "right" }}>
+                            <td className="action-cell">
                               <button
                                 className="danger-text-button"
                                 onClick={() => handleDeleteItem("team_members", "name", member)}
@@ -452,7 +469,7 @@ export function ManagementDashboard({ onBack }: ManagementDashboardProps) {
                         ))}
                         {choices.teamMembers.length === 0 && (
                           <tr>
-                            <td colSpan={2} style={{ color: "var(--muted)" }}>No custom reviewers.</td>
+                            <td colSpan={2} className="empty-cell">No custom reviewers.</td>
                           </tr>
                         )}
                       </tbody>
@@ -592,7 +609,7 @@ export function ManagementDashboard({ onBack }: ManagementDashboardProps) {
                         <tr>
                           <th>Species Name</th>
                           <th>Category</th>
-                          <th style={{ width: "80px", textAlign: "right" }}>Action</th>
+                          <th className="action-cell">Action</th>
                         </tr>
                       </thead>
                       <tbody>
@@ -604,7 +621,7 @@ export function ManagementDashboard({ onBack }: ManagementDashboardProps) {
                                 {spec.type}
                               </span>
                             </td>
-                            <td style={{ textAlign: "right" }}>
+                            <td className="action-cell">
                               <button
                                 className="danger-text-button"
                                 onClick={() => handleDeleteItem("species", "name", spec.name)}
@@ -628,7 +645,7 @@ export function ManagementDashboard({ onBack }: ManagementDashboardProps) {
                         <tr>
                           <th>Behavior</th>
                           <th>Category</th>
-                          <th style={{ width: "80px", textAlign: "right" }}>Action</th>
+                          <th className="action-cell">Action</th>
                         </tr>
                       </thead>
                       <tbody>
@@ -640,7 +657,7 @@ export function ManagementDashboard({ onBack }: ManagementDashboardProps) {
                                 {beh.type}
                               </span>
                             </td>
-                            <td style={{ textAlign: "right" }}>
+                            <td className="action-cell">
                               <button
                                 className="danger-text-button"
                                 onClick={() => handleDeleteItem("behaviors", "name", beh.name)}
@@ -732,7 +749,7 @@ export function ManagementDashboard({ onBack }: ManagementDashboardProps) {
                         <th>Type</th>
                         <th>Species</th>
                         <th>Behavior</th>
-                        <th style={{ width: "80px", textAlign: "right" }}>Action</th>
+                        <th className="action-cell">Action</th>
                       </tr>
                     </thead>
                     <tbody>
@@ -746,7 +763,7 @@ export function ManagementDashboard({ onBack }: ManagementDashboardProps) {
                           </td>
                           <td>{temp.species}</td>
                           <td>{temp.behavior}</td>
-                          <td style={{ textAlign: "right" }}>
+                          <td className="action-cell">
                             <button
                               className="danger-text-button"
                               onClick={() => {
@@ -760,7 +777,7 @@ export function ManagementDashboard({ onBack }: ManagementDashboardProps) {
                       ))}
                       {choices.templates.length === 0 && (
                         <tr>
-                          <td colSpan={5} style={{ color: "var(--muted)" }}>No custom templates configured.</td>
+                          <td colSpan={5} className="empty-cell">No custom templates configured.</td>
                         </tr>
                       )}
                     </tbody>
@@ -0,0 +1,101 @@
+import { describe, expect, test } from "vitest";
+import { parseExifCaptureTime, readExifCaptureTime } from "./exif";
+
+type ExifDates = {
+  dateTime?: string;
+  dateTimeOriginal?: string;
+  littleEndian?: boolean;
+};
+
+// Builds a JPEG head holding a single EXIF APP1 segment with the given dates.
+function buildJpegHead({ dateTime, dateTimeOriginal, littleEndian = true }: ExifDates) {
+  const ifd0Entries = [dateTime ? 0x0132 : null, dateTimeOriginal ? 0x8769 : null].filter(
+    (tag): tag is number => tag !== null,
+  );
+  const ifd0Offset = 8;
+  const exifIfdOffset = ifd0Offset + 2 + ifd0Entries.length * 12 + 4;
+  const dateTimeOffset = exifIfdOffset + (dateTimeOriginal ? 18 : 0);
+  const dateTimeOriginalOffset = dateTimeOffset + (dateTime ? 20 : 0);
+  const tiffLength = dateTimeOriginalOffset + (dateTimeOriginal ? 20 : 0);
+
+  const tiff = new DataView(new ArrayBuffer(tiffLength));
+  tiff.setUint16(0, littleEndian ? 0x4949 : 0x4d4d);
+  tiff.setUint16(2, 42, littleEndian);
+  tiff.setUint32(4, ifd0Offset, littleEndian);
+
+  const writeEntry = (entryOffset: number, tag: number, type: number, count: number, value: number) => {
+    tiff.setUint16(entryOffset, tag, littleEndian);
+    tiff.setUint16(entryOffset + 2, type, littleEndian);
+    tiff.setUint32(entryOffset + 4, count, littleEndian);
+    tiff.setUint32(entryOffset + 8, value, littleEndian);
+  };
+  const writeText = (textOffset: number, text: string) => {
+    Array.from(text).forEach((character, charIndex) => {
+      tiff.setUint8(textOffset + charIndex, character.charCodeAt(0));
+    });
+  };
+
+  tiff.setUint16(ifd0Offset, ifd0Entries.length, littleEndian);
+  ifd0Entries.forEach((tag, entryIndex) => {
+    const entryOffset = ifd0Offset + 2 + entryIndex * 12;
+    if (tag === 0x0132) {
+      writeEntry(entryOffset, tag, 2, 20, dateTimeOffset);
+    } else {
+      writeEntry(entryOffset, tag, 4, 1, exifIfdOffset);
+    }
+  });
+  if (dateTime) {
+    writeText(dateTimeOffset, dateTime);
+  }
+  if (dateTimeOriginal) {
+    tiff.setUint16(exifIfdOffset, 1, littleEndian);
+    writeEntry(exifIfdOffset + 2, 0x9003, 2, 20, dateTimeOriginalOffset);
+    writeText(dateTimeOriginalOffset, dateTimeOriginal);
+  }
+
+  const bytes = new Uint8Array(2 + 4 + 6 + tiffLength + 2);
+  const head = new DataView(bytes.buffer);
+  head.setUint16(0, 0xffd8);
+  head.setUint16(2, 0xffe1);
+  head.setUint16(4, 2 + 6 + tiffLength);
+  bytes.set([0x45, 0x78, 0x69, 0x66, 0, 0], 6);
+  bytes.set(new Uint8Array(tiff.buffer), 12);
+  head.setUint16(12 + tiffLength, 0xffda);
+  return bytes.buffer;
+}
+
+describe("EXIF capture time", () => {
+  test("prefers DateTimeOriginal over the IFD0 DateTime", () => {
+    expect(
+      parseExifCaptureTime(
+        buildJpegHead({ dateTime: "2026:05:02 08:00:00", dateTimeOriginal: "2026:04:24 10:00:15" }),
+      ),
+    ).toBe("2026-04-24 10:00:15");
+  });
+
+  test("falls back to DateTime in big-endian files", () => {
+    expect(
+      parseExifCaptureTime(buildJpegHead({ dateTime: "2026:04:24 10:01:00", littleEndian: false })),
+    ).toBe("2026-04-24 10:01:00");
+  });
+
+  test("ignores blank dates, truncated heads, and non-JPEG files", () => {
+    const head = buildJpegHead({ dateTimeOriginal: "0000:00:00 00:00:00" });
+
+    expect(parseExifCaptureTime(head)).toBe("");
+    expect(parseExifCaptureTime(buildJpegHead({ dateTimeOriginal: "2026:04:24 10:00:15" }).slice(0, 30))).toBe("");
+    expect(parseExifCaptureTime(new TextEncoder().encode("not an image").buffer)).toBe("");
+  });
+
+  test("reads past the probe when a large segment pushes the dates further in", async () => {
+    const head = new Uint8Array(buildJpegHead({ dateTimeOriginal: "2026:04:24 10:00:15" }));
+    const paddingLength = 20 * 1024;
+    const file = new Uint8Array(head.length + 4 + paddingLength);
+    file.set(head.subarray(0, 2));
+    new DataView(file.buffer).setUint16(2, 0xffe0);
+    new DataView(file.buffer).setUint16(4, 2 + paddingLength);
+    file.set(head.subarray(2), 6 + paddingLength);
+
+    await expect(readExifCaptureTime(new Blob([file]))).resolves.toBe("2026-04-24 10:00:15");
+  });
+});
@@ -0,0 +1,122 @@
+// Camera traps write the capture time into the JPEG APP1 segment, which sits
+// before any pixel data, so only the head of each file needs to be read.
+export const EXIF_HEAD_BYTES = 64 * 1024;
+// The date tags normally sit in the first few kilobytes; the full head is only
+// needed when a large embedded preview pushes them further in.
+const EXIF_PROBE_BYTES = 16 * 1024;
+
+const JPEG_START = 0xffd8;
+const APP1_MARKER = 0xe1;
+const START_OF_SCAN_MARKER = 0xda;
+const EXIF_IFD_POINTER_TAG = 0x8769;
+const DATE_TIME_ORIGINAL_TAG = 0x9003;
+const DATE_TIME_TAG = 0x0132;
+const EXIF_DATE_LENGTH = 19;
+const EXIF_DATE_PATTERN = /^(\d{4}):(\d{2}):(\d{2}) (\d{2}:\d{2}:\d{2})$/;
+
+type TiffReader = {
+  view: DataView;
+  start: number;
+  littleEndian: boolean;
+};
+
+function findTagValueOffset(reader: TiffReader, ifdOffset: number, tag: number) {
+  const { view, start, littleEndian } = reader;
+  const entryCount = view.getUint16(start + ifdOffset, littleEndian);
+
+  for (let entryIndex = 0; entryIndex < entryCount; entryIndex += 1) {
+    const entryOffset = start + ifdOffset + 2 + entryIndex * 12;
+    if (view.getUint16(entryOffset, littleEndian) === tag) {
+      return entryOffset + 8;
+    }
+  }
+
+  return null;
+}
+
+function readExifDate(reader: TiffReader, ifdOffset: number, tag: number) {
+  const valueOffset = findTagValueOffset(reader, ifdOffset, tag);
+  if (valueOffset === null) {
+    return "";
+  }
+
+  const { view, start, littleEndian } = reader;
+  const textOffset = start + view.getUint32(valueOffset, littleEndian);
+  let text = "";
+  for (let charIndex = 0; charIndex < EXIF_DATE_LENGTH; charIndex += 1) {
+    text += String.fromCharCode(view.getUint8(textOffset + charIndex));
+  }
+
+  // Cameras without a clock fill the field with blanks or zeros.
+  const match = EXIF_DATE_PATTERN.exec(text);
+  return match && match[1] !== "0000" ? `${match[1]}-${match[2]}-${match[3]} ${match[4]}` : "";
+}
+
+function findExifStart(view: DataView) {
+  if (view.byteLength < 4 || view.getUint16(0) !== JPEG_START) {
+    return null;
+  }
+
+  let offset = 2;
+  while (offset + 4 <= view.byteLength && view.getUint8(offset) === 0xff) {
+    const marker = view.getUint8(offset + 1);
+    if (marker === START_OF_SCAN_MARKER) {
+      return null;
+    }
+
+    // "Exif\0\0" follows the segment length in an EXIF APP1 segment.
+    if (marker === APP1_MARKER && view.getUint32(offset + 4) === 0x45786966 && view.getUint16(offset + 8) === 0) {
+      return offset + 10;
+    }
+
+    offset += 2 + view.getUint16(offset + 2);
+  }
+
+  return null;
+}
+
+// Returns the EXIF capture time as "YYYY-MM-DD HH:MM:SS", preferring
+// DateTimeOriginal over the IFD0 DateTime, or "" when neither is readable.
+export function parseExifCaptureTime(buffer: ArrayBuffer) {
+  const view = new DataView(buffer);
+
+  try {
+    const start = findExifStart(view);
+    if (start === null) {
+      return "";
+    }
+
+    const byteOrder = view.getUint16(start);
+    if (byteOrder !== 0x4949 && byteOrder !== 0x4d4d) {
+      return "";
+    }
+
+    const reader = { view, start, littleEndian: byteOrder === 0x4949 };
+    const firstIfdOffset = view.getUint32(start + 4, reader.littleEndian);
+    const exifPointerOffset = findTagValueOffset(reader, firstIfdOffset, EXIF_IFD_POINTER_TAG);
+    const originalTime =
+      exifPointerOffset === null
+        ? ""
+        : readExifDate(reader, view.getUint32(exifPointerOffset, reader.littleEndian), DATE_TIME_ORIGINAL_TAG);
+
+    return originalTime || readExifDate(reader, firstIfdOffset, DATE_TIME_TAG);
+  } catch {
+    // Offsets past the head of the file or a truncated segment.
+    return "";
+  }
+}
+
+export async function readExifCaptureTime(file: Blob) {
+  const probe = await file.slice(0, EXIF_PROBE_BYTES).arrayBuffer();
+  const captureTime = parseExifCaptureTime(probe);
+  if (captureTime || file.size <= EXIF_PROBE_BYTES) {
+    return captureTime;
+  }
+
+  // Only the rest of the head is read; the probe bytes are reused.
+  const rest = await file.slice(EXIF_PROBE_BYTES, EXIF_HEAD_BYTES).arrayBuffer();
+  const head = new Uint8Array(probe.byteLength + rest.byteLength);
+  head.set(new Uint8Array(probe));
+  head.set(new Uint8Array(rest), probe.byteLength);
+  return parseExifCaptureTime(head.buffer);
+}
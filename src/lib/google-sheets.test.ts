@@ -1,9 +1,50 @@
-import { describe, expect, test } from "vitest";
-import { getGoogleSheetsStatus } from "./google-sheets";
+import { generateKeyPairSync } from "node:crypto";
+import { afterEach, beforeEach, describe, expect, test, vi } from "vitest";
+import { ANNOTATION_COLUMNS, type AnnotationRecord } from "@/lib/annotation-data";
+
+const annotation: AnnotationRecord = {
+  "Start Filename": "image-001.jpg",
+  "End Filename": "image-002.jpg",
+  Site: "Location 1",
+  Camera: "LOC001",
+  "Retrieval Date": "2026-04-24",
+  Type: "Seabird",
+  Species: "Black-footed Albatross (Phoebastria nigripes)",
+  Behavior: "Cleaning",
+  "Sequence Start Time": "2026-04-24 10:00:00",
+  "Sequence End Time": "2026-04-24 10:01:00",
+  "Is Single Image": "false",
+  "Reviewer Name": "KG",
+  Notes: "",
+};
+
+const { privateKey } = generateKeyPairSync("rsa", {
+  modulusLength: 2048,
+  privateKeyEncoding: { type: "pkcs8", format: "pem" },
+  publicKeyEncoding: { type: "spki", format: "pem" },
+});
+
+function stubSheetsCredentials() {
+  vi.stubEnv("GOOGLE_SERVICE_ACCOUNT_EMAIL", "service@example.iam.gserviceaccount.com");
+  vi.stubEnv("GOOGLE_PRIVATE_KEY", privateKey);
+  vi.stubEnv("GOOGLE_SHEETS_SPREADSHEET_ID", "sheet-id");
+}
+
+let sheets: typeof import("./google-sheets");
+
+beforeEach(async () => {
+  // The module caches config, tokens, headers and assignments between calls.
+  vi.resetModules();
+  sheets = await import("./google-sheets");
+});
+
+afterEach(() => {
+  vi.unstubAllEnvs();
+});
 
 describe("getGoogleSheetsStatus", () => {
   test("reports missing server credentials without exposing secrets", () => {
-    const status = getGoogleSheetsStatus({});
+    const status = sheets.getGoogleSheetsStatus({});
 
     expect(status.configured).toBe(false);
     expect(status.missing).toContain("GOOGLE_SERVICE_ACCOUNT_EMAIL or GOOGLE_SERVICE_ACCOUNT_JSON");
@@ -12,7 +53,7 @@ describe("getGoogleSheetsStatus", () => {
   });
 
   test("accepts one spreadsheet id shared by assignments and annotations", () => {
-    const status = getGoogleSheetsStatus({
+    const status = sheets.getGoogleSheetsStatus({
       GOOGLE_SERVICE_ACCOUNT_EMAIL: "service@example.iam.gserviceaccount.com",
       GOOGLE_PRIVATE_KEY: "private-key-placeholder",
       GOOGLE_SHEETS_SPREADSHEET_ID: "sheet-id",
@@ -26,3 +67,105 @@ describe("getGoogleSheetsStatus", () => {
     });
   });
 });
+
+describe("appendAnnotationRows", () => {
+  test("appends a large backlog in chunks and leaves the header out of the row count", async () => {
+    stubSheetsCredentials();
+
+    const appendedChunks: string[][][] = [];
+    vi.mocked(fetch).mockImplementation(async (input, init) => {
+      const url = String(input);
+      if (url.startsWith("https://oauth2.googleapis.com/")) {
+        return Response.json({ access_token: "access-token", expires_in: 3600 });
+      }
+      if (url.includes(":append")) {
+        const { values } = JSON.parse(String(init?.body)) as { values: string[][] };
+        appendedChunks.push(values);
+        return Response.json({ updates: { updatedRows: values.length } });
+      }
+      return Response.json({});
+    });
+
+    const result = await sheets.appendAnnotationRows(Array.from({ length: 5001 }, () => annotation));
+
+    expect(appendedChunks.map((chunk) => chunk.length)).toEqual([5000, 2]);
+    expect(appendedChunks[0][0]).toEqual([...ANNOTATION_COLUMNS]);
+    expect(appendedChunks[1][1][0]).toBe("image-001.jpg");
+    expect(result).toEqual({ updates: { updatedRows: 5001 } });
+  });
+
+  test("reports how many rows landed when a later chunk fails", async () => {
+    stubSheetsCredentials();
+    let appendCount = 0;
+    vi.mocked(fetch).mockImplementation(async (input, init) => {
+      const url = String(input);
+      if (url.startsWith("https://oauth2.googleapis.com/")) {
+        return Response.json({ access_token: "access-token", expires_in: 3600 });
+      }
+      if (url.includes(":append")) {
+        appendCount += 1;
+        if (appendCount === 2) {
+          throw new TypeError("fetch failed");
+        }
+        const { values } = JSON.parse(String(init?.body)) as { values: string[][] };
+        return Response.json({ updates: { updatedRows: values.length } });
+      }
+      return Response.json({ values: [[...ANNOTATION_COLUMNS]] });
+    });
+
+    const error = await sheets
+      .appendAnnotationRows(Array.from({ length: 5001 }, () => annotation))
+      .catch((appendError: unknown) => appendError);
+
+    expect(sheets.isSheetAppendError(error)).toBe(true);
+    expect(error).toMatchObject({ appendedRows: 5000 });
+  });
+});
+
+describe("readSheetRows", () => {
+  test("serves cached assignments and refreshes them in the background once stale", async () => {
+    stubSheetsCredentials();
+    let sheetReads = 0;
+    vi.mocked(fetch).mockImplementation(async (input) => {
+      if (String(input).startsWith("https://oauth2.googleapis.com/")) {
+        return Response.json({ access_token: "access-token", expires_in: 3600 });
+      }
+      sheetReads += 1;
+      return Response.json({ values: [["Reviewer"], [`Reviewer ${sheetReads}`]] });
+    });
+    const startedAt = Date.now();
+    const now = vi.spyOn(Date, "now").mockReturnValue(startedAt);
+
+    expect((await sheets.readSheetRows("assignments")).rows).toEqual([{ Reviewer: "Reviewer 1" }]);
+    expect((await sheets.readSheetRows("assignments")).rows).toEqual([{ Reviewer: "Reviewer 1" }]);
+    expect(sheetReads).toBe(1);
+
+    now.mockReturnValue(startedAt + 5 * 60_000 + 1);
+    expect((await sheets.readSheetRows("assignments")).rows).toEqual([{ Reviewer: "Reviewer 1" }]);
+    await vi.waitFor(() => expect(sheetReads).toBe(2));
+    await vi.waitFor(async () => {
+      expect((await sheets.readSheetRows("assignments")).rows).toEqual([{ Reviewer: "Reviewer 2" }]);
+    });
+  });
+
+  test("stops serving assignments that could not be refreshed for several TTLs", async () => {
+    stubSheetsCredentials();
+    let sheetAvailable = true;
+    vi.mocked(fetch).mockImplementation(async (input) => {
+      if (String(input).startsWith("https://oauth2.googleapis.com/")) {
+        return Response.json({ access_token: "access-token", expires_in: 3600 });
+      }
+      return sheetAvailable
+        ? Response.json({ values: [["Reviewer"], ["KG"]] })
+        : new Response("Requested entity was not found.", { status: 404 });
+    });
+    const startedAt = Date.now();
+    const now = vi.spyOn(Date, "now").mockReturnValue(startedAt);
+
+    expect((await sheets.readSheetRows("assignments")).rows).toEqual([{ Reviewer: "KG" }]);
+
+    sheetAvailable = false;
+    now.mockReturnValue(startedAt + 20 * 60_000 + 1);
+    await expect(sheets.readSheetRows("assignments")).rejects.toThrow("Google Sheets request failed");
+  });
+});
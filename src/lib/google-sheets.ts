@@ -1,21 +1,47 @@
-import { createSign } from "node:crypto";
-import { ANNOTATION_COLUMNS, type AnnotationRecord } from "@/lib/annotation-data";
+import { createPrivateKey, createSign, type KeyObject } from "node:crypto";
+import {
+  ANNOTATION_COLUMNS,
+  type AnnotationColumn,
+  type AnnotationRecord,
+} from "@/lib/annotation-data";
 
 const GOOGLE_TOKEN_URL = "https://oauth2.googleapis.com/token";
 const GOOGLE_SHEETS_BASE_URL = "https://sheets.googleapis.com/v4/spreadsheets";
 const SHEETS_SCOPE = "https://www.googleapis.com/auth/spreadsheets";
+// Keeps each append inside the Sheets API request size limits.
+const APPEND_CHUNK_SIZE = 5000;
+const ANNOTATION_COLUMN_SET = new Set<string>(ANNOTATION_COLUMNS);
+const ASSIGNMENTS_TTL_MS = 5 * 60_000;
+// Past this age a failing background refresh surfaces instead of serving stale rows.
+const ASSIGNMENTS_MAX_STALE_MS = 4 * ASSIGNMENTS_TTL_MS;
+const HEADER_TTL_MS = 5 * 60_000;
 
 type SheetKind = "assignments" | "annotations";
 
 type SheetConfig = {
   clientEmail: string;
-  privateKey: string;
+  privateKey: KeyObject;
   assignmentsSpreadsheetId: string;
   annotationsSpreadsheetId: string;
   assignmentsSheetName: string;
   annotationsSheetName: string;
 };
 
+type SheetTarget = {
+  spreadsheetId: string;
+  sheetName: string;
+};
+
+type AssignmentsCache = {
+  sheet: SheetRows;
+  fetchedAt: number;
+};
+
+type HeaderCache = {
+  headers: string[];
+  fetchedAt: number;
+};
+
 type TokenCache = {
   accessToken: string;
   expiresAt: number;
@@ -40,7 +66,22 @@ export class SheetConfigError extends Error {
   }
 }
 
+export class SheetAppendError extends Error {
+  appendedRows: number;
+
+  constructor(message: string, appendedRows: number, options?: ErrorOptions) {
+    super(message, options);
+    this.name = "SheetAppendError";
+    this.appendedRows = appendedRows;
+  }
+}
+
+let configCache: SheetConfig | null = null;
 let tokenCache: TokenCache | null = null;
+let pendingToken: Promise<string> | null = null;
+const headerCache = new Map<string, HeaderCache>();
+let assignmentsCache: AssignmentsCache | null = null;
+let pendingAssignments: Promise<SheetRows> | null = null;
 
 function parseServiceAccountJson() {
   const rawJson = process.env.GOOGLE_SERVICE_ACCOUNT_JSON;
@@ -99,6 +140,10 @@ export function getGoogleSheetsStatus(
 }
 
 function getSheetConfig(): SheetConfig {
+  if (configCache) {
+    return configCache;
+  }
+
   const fromJson = parseServiceAccountJson();
   const clientEmail =
     fromJson?.clientEmail ?? process.env.GOOGLE_SERVICE_ACCOUNT_EMAIL ?? "";
@@ -122,14 +167,22 @@ function getSheetConfig(): SheetConfig {
     );
   }
 
-  return {
+  let signingKey: KeyObject;
+  try {
+    signingKey = createPrivateKey(privateKey);
+  } catch {
+    throw new SheetConfigError("The Google service account private key could not be parsed.");
+  }
+
+  configCache = {
     clientEmail,
-    privateKey,
+    privateKey: signingKey,
     assignmentsSpreadsheetId,
     annotationsSpreadsheetId,
     assignmentsSheetName: process.env.GOOGLE_ASSIGNMENTS_SHEET_NAME ?? "Sheet1",
     annotationsSheetName: process.env.GOOGLE_ANNOTATIONS_SHEET_NAME ?? "Sheet1",
   };
+  return configCache;
 }
 
 function base64UrlEncode(value: string) {
@@ -163,11 +216,7 @@ function signJwt(config: SheetConfig) {
   return `${unsignedToken}.${signature}`;
 }
 
-async function getAccessToken(config: SheetConfig) {
-  if (tokenCache && tokenCache.expiresAt - 60_000 > Date.now()) {
-    return tokenCache.accessToken;
-  }
-
+async function requestAccessToken(config: SheetConfig) {
   const response = await fetch(GOOGLE_TOKEN_URL, {
     method: "POST",
     headers: {
@@ -197,12 +246,23 @@ async function getAccessToken(config: SheetConfig) {
   return tokenCache.accessToken;
 }
 
+async function getAccessToken(config: SheetConfig) {
+  if (tokenCache && tokenCache.expiresAt - 60_000 > Date.now()) {
+    return tokenCache.accessToken;
+  }
+
+  pendingToken ??= requestAccessToken(config).finally(() => {
+    pendingToken = null;
+  });
+  return pendingToken;
+}
+
 function sheetRange(sheetName: string, range: string) {
   const escapedSheetName = sheetName.replace(/'/g, "''");
   return `'${escapedSheetName}'!${range}`;
 }
 
-function getSheetTarget(config: SheetConfig, kind: SheetKind) {
+function getSheetTarget(config: SheetConfig, kind: SheetKind): SheetTarget {
   if (kind === "assignments") {
     if (!config.assignmentsSpreadsheetId) {
       throw new SheetConfigError("GOOGLE_ASSIGNMENTS_SPREADSHEET_ID is missing.");
@@ -246,7 +306,7 @@ async function sheetsRequest<T>(
   return (await response.json()) as T;
 }
 
-export async function readSheetRows(kind: SheetKind): Promise<SheetRows> {
+async function fetchSheetRows(kind: SheetKind): Promise<SheetRows> {
   const config = getSheetConfig();
   const target = getSheetTarget(config, kind);
   const range = encodeURIComponent(sheetRange(target.sheetName, "A:ZZ"));
@@ -256,62 +316,130 @@ export async function readSheetRows(kind: SheetKind): Promise<SheetRows> {
     `/values/${range}`,
   );
   const values = response.values ?? [];
-  const headers = values[0] ?? [];
+  const headers = values.shift() ?? [];
 
-  return {
-    headers,
-    rows: values.slice(1).map((rowValues) =>
-      Object.fromEntries(
-        headers.map((header, headerIndex) => [
-          header,
-          rowValues[headerIndex] ?? "",
-        ]),
-      ),
-    ),
-  };
+  const rows = values.map((rowValues) => {
+    const row: Record<string, string> = {};
+    for (let headerIndex = 0; headerIndex < headers.length; headerIndex += 1) {
+      row[headers[headerIndex]] = rowValues[headerIndex] ?? "";
+    }
+    return row;
+  });
+
+  return { headers, rows };
+}
+
+function refreshAssignments() {
+  pendingAssignments ??= fetchSheetRows("assignments")
+    .then((sheet) => {
+      assignmentsCache = { sheet, fetchedAt: Date.now() };
+      return sheet;
+    })
+    .finally(() => {
+      pendingAssignments = null;
+    });
+  return pendingAssignments;
+}
+
+export async function readSheetRows(kind: SheetKind): Promise<SheetRows> {
+  if (kind !== "assignments") {
+    return fetchSheetRows(kind);
+  }
+
+  if (!assignmentsCache || Date.now() - assignmentsCache.fetchedAt > ASSIGNMENTS_MAX_STALE_MS) {
+    assignmentsCache = null;
+    return refreshAssignments();
+  }
+  if (Date.now() - assignmentsCache.fetchedAt > ASSIGNMENTS_TTL_MS) {
+    refreshAssignments().catch((error) => {
+      console.error("Background refresh of Google Sheets assignments failed:", error);
+    });
+  }
+  return assignmentsCache.sheet;
+}
+
+function headerCacheKey(target: SheetTarget) {
+  return `${target.spreadsheetId}:${target.sheetName}`;
 }
 
-function toCellValue(value: string | undefined) {
-  return value ?? "";
+async function readHeaderRow(config: SheetConfig, target: SheetTarget) {
+  const cachedHeaders = headerCache.get(headerCacheKey(target));
+  if (cachedHeaders && Date.now() - cachedHeaders.fetchedAt <= HEADER_TTL_MS) {
+    return cachedHeaders.headers;
+  }
+
+  const range = encodeURIComponent(sheetRange(target.sheetName, "1:1"));
+  const response = await sheetsRequest<{ values?: string[][] }>(
+    config,
+    target.spreadsheetId,
+    `/values/${range}`,
+  );
+  const headers = response.values?.[0] ?? [];
+  if (headers.length) {
+    headerCache.set(headerCacheKey(target), { headers, fetchedAt: Date.now() });
+  }
+  return headers;
 }
 
 export async function appendAnnotationRows(records: AnnotationRecord[]) {
   const config = getSheetConfig();
   const target = getSheetTarget(config, "annotations");
-  const currentRows = await readSheetRows("annotations");
-  const headers = currentRows.headers.length
-    ? currentRows.headers
-    : [...ANNOTATION_COLUMNS];
-
-  if (!currentRows.headers.length) {
-    const headerRange = encodeURIComponent(sheetRange(target.sheetName, "A1:M1"));
-    await sheetsRequest(
-      config,
-      target.spreadsheetId,
-      `/values/${headerRange}?valueInputOption=RAW`,
-      {
-        method: "PUT",
-        body: JSON.stringify({ values: [ANNOTATION_COLUMNS] }),
-      },
-    );
-  }
+  const existingHeaders = await readHeaderRow(config, target);
+  const headers = existingHeaders.length ? existingHeaders : [...ANNOTATION_COLUMNS];
 
+  const rowColumns = headers.map((header) =>
+    ANNOTATION_COLUMN_SET.has(header) ? (header as AnnotationColumn) : null,
+  );
   const values = records.map((record) =>
-    headers.map((header) => toCellValue(record[header as keyof AnnotationRecord])),
+    rowColumns.map((column) => (column ? record[column] : "")),
   );
+  // An empty sheet gets its header row in the same append request as the data.
+  if (!existingHeaders.length) {
+    values.unshift(headers);
+  }
   const appendRange = encodeURIComponent(sheetRange(target.sheetName, "A:M"));
 
-  return sheetsRequest<{ updates?: { updatedRows?: number } }>(
-    config,
-    target.spreadsheetId,
-    `/values/${appendRange}:append?valueInputOption=USER_ENTERED&insertDataOption=INSERT_ROWS`,
-    {
-      method: "POST",
-      body: JSON.stringify({ values }),
-    },
-  );
+  let updatedRows = 0;
+  let sentValues = 0;
+  try {
+    for (let rowIndex = 0; rowIndex < values.length; rowIndex += APPEND_CHUNK_SIZE) {
+      const chunk =
+        values.length <= APPEND_CHUNK_SIZE ? values : values.slice(rowIndex, rowIndex + APPEND_CHUNK_SIZE);
+      const result = await sheetsRequest<{ updates?: { updatedRows?: number } }>(
+        config,
+        target.spreadsheetId,
+        `/values/${appendRange}:append?valueInputOption=USER_ENTERED&insertDataOption=INSERT_ROWS`,
+        {
+          method: "POST",
+          body: JSON.stringify({ values: chunk }),
+        },
+      );
+      updatedRows += result.updates?.updatedRows ?? 0;
+      sentValues += chunk.length;
+    }
+  } catch (error) {
+    // The sheet may have been edited since the headers were read.
+    headerCache.delete(headerCacheKey(target));
+    // Earlier chunks are already in the sheet, so a retry must resume after them.
+    const appendedRows = Math.max(0, sentValues - (existingHeaders.length ? 0 : 1));
+    throw new SheetAppendError(
+      `Google Sheets append stopped after ${appendedRows} of ${records.length} rows.`,
+      appendedRows,
+      { cause: error },
+    );
+  }
+
+  if (!existingHeaders.length) {
+    headerCache.set(headerCacheKey(target), { headers, fetchedAt: Date.now() });
+    updatedRows = Math.max(0, updatedRows - 1);
+  }
+  return { updates: { updatedRows } };
 }
 
 export function isSheetConfigError(error: unknown): error is SheetConfigError {
   return error instanceof SheetConfigError;
 }
+
+export function isSheetAppendError(error: unknown): error is SheetAppendError {
+  return error instanceof SheetAppendError;
+}
@@ -1,4 +1,4 @@
-import { describe, expect, test } from "vitest";
+import { afterEach, beforeEach, describe, expect, test, vi } from "vitest";
 import {
   buildSynologyBaseUrl,
   getSynologyStatus,
@@ -51,3 +51,93 @@ describe("Synology configuration", () => {
     expect(getSynologyUserMessage(error)).toContain("same network");
   });
 });
+
+describe("Synology sessions", () => {
+  let synology: typeof import("./synology");
+
+  beforeEach(async () => {
+    vi.stubEnv("SYNOLOGY_BASE_URL", "https://nas.example.com");
+    vi.stubEnv("SYNOLOGY_USERNAME", "reviewer");
+    vi.stubEnv("SYNOLOGY_PASSWORD", "secret");
+    vi.stubEnv("SYNOLOGY_DEFAULT_FOLDER", "/volume1/cameras");
+    // The module caches its config, session id and pending login.
+    vi.resetModules();
+    synology = await import("./synology");
+  });
+
+  afterEach(() => {
+    vi.unstubAllEnvs();
+  });
+
+  function mockNas(handleEntry: (params: URLSearchParams) => Response) {
+    const logins: string[] = [];
+    const entrySids: string[] = [];
+    vi.mocked(fetch).mockImplementation(async (input) => {
+      const url = new URL(String(input));
+      if (url.pathname === "/webapi/auth.cgi") {
+        const sid = `sid-${logins.length + 1}`;
+        logins.push(sid);
+        return Response.json({ success: true, data: { sid } });
+      }
+      entrySids.push(url.searchParams.get("_sid") ?? "");
+      return handleEntry(url.searchParams);
+    });
+    return { logins, entrySids };
+  }
+
+  const imageResponse = () => new Response("jpeg-bytes", { headers: { "Content-Type": "image/jpeg" } });
+
+  test("shares one login between concurrent list and image requests", async () => {
+    const nas = mockNas((params) =>
+      params.get("api") === "SYNO.FileStation.List"
+        ? Response.json({ success: true, data: { files: [] } })
+        : imageResponse(),
+    );
+
+    await Promise.all([
+      synology.listSynologyImages("/volume1/cameras"),
+      synology.downloadSynologyImage("/volume1/cameras/image-001.jpg"),
+      synology.downloadSynologyImage("/volume1/cameras/image-002.jpg", { thumbnail: true }),
+    ]);
+
+    expect(nas.logins).toEqual(["sid-1"]);
+    expect(nas.entrySids).toEqual(["sid-1", "sid-1", "sid-1"]);
+  });
+
+  test("logs in again and retries once when the session has expired", async () => {
+    let listCalls = 0;
+    const nas = mockNas(() => {
+      listCalls += 1;
+      return listCalls === 1
+        ? Response.json({ success: false, error: { code: 119 } })
+        : Response.json({ success: true, data: { files: [] } });
+    });
+
+    await expect(synology.listSynologyImages("/volume1/cameras")).resolves.toEqual([]);
+
+    expect(nas.logins).toEqual(["sid-1", "sid-2"]);
+    expect(nas.entrySids).toEqual(["sid-1", "sid-2"]);
+  });
+
+  test.each([105, 408])("does not retry error %i", async (code) => {
+    const nas = mockNas(() => Response.json({ success: false, error: { code } }));
+
+    await expect(synology.listSynologyImages("/volume1/cameras")).rejects.toThrow(
+      "Synology request failed",
+    );
+
+    expect(nas.logins).toEqual(["sid-1"]);
+    expect(nas.entrySids).toEqual(["sid-1"]);
+  });
+
+  test("throws JSON error bodies from image downloads instead of returning them as bytes", async () => {
+    mockNas(() => Response.json({ success: false, error: { code: 408 } }));
+
+    await expect(synology.downloadSynologyImage("/volume1/cameras/image-001.jpg")).rejects.toThrow(
+      "Synology request failed",
+    );
+    await expect(
+      synology.downloadSynologyImage("/volume1/cameras/image-001.jpg", { thumbnail: true }),
+    ).rejects.toThrow("Synology request failed");
+  });
+});
@@ -1,4 +1,8 @@
 const IMAGE_EXTENSIONS = new Set([".jpg", ".jpeg", ".png", ".webp"]);
+const THUMBNAIL_MIN_BYTES = 80 * 1024;
+const SESSION_TTL_MS = 10 * 60_000;
+// SYNO.API error codes that mean the session id must be replaced.
+const SESSION_ERROR_CODES = new Set([106, 107, 119]);
 
 export type SynologyStatus = {
   configured: boolean;
@@ -12,6 +16,7 @@ export type SynologyImage = {
   size: number;
   captureTime: string;
   url: string;
+  thumbnailUrl: string;
 };
 
 type SynologyConfig = {
@@ -23,6 +28,11 @@ type SynologyConfig = {
   allowedFolderPrefix: string;
 };
 
+type SessionCache = {
+  sid: string;
+  expiresAt: number;
+};
+
 type SynologyBaseInput = {
   baseUrl?: string;
   port?: string;
@@ -60,6 +70,17 @@ export class SynologyConfigError extends Error {
   }
 }
 
+class SynologySessionError extends Error {
+  constructor(message: string) {
+    super(message);
+    this.name = "SynologySessionError";
+  }
+}
+
+let configCache: SynologyConfig | null = null;
+let sessionCache: SessionCache | null = null;
+let pendingLogin: Promise<string> | null = null;
+
 export function buildSynologyBaseUrl({ baseUrl = "", port }: SynologyBaseInput) {
   if (!baseUrl) {
     return "";
@@ -154,6 +175,10 @@ function getErrorDetails(error: unknown): { code?: string; message: string } {
 }
 
 function getSynologyConfig(): SynologyConfig {
+  if (configCache) {
+    return configCache;
+  }
+
   const status = getSynologyStatus();
   if (!status.configured) {
     throw new SynologyConfigError(`Missing Synology settings: ${status.missing.join(", ")}`);
@@ -165,7 +190,7 @@ function getSynologyConfig(): SynologyConfig {
   });
   const defaultFolder = process.env.SYNOLOGY_DEFAULT_FOLDER ?? "";
 
-  return {
+  configCache = {
     baseUrl,
     username: process.env.SYNOLOGY_USERNAME ?? "",
     password: process.env.SYNOLOGY_PASSWORD ?? "",
@@ -173,6 +198,7 @@ function getSynologyConfig(): SynologyConfig {
     defaultFolder,
     allowedFolderPrefix: process.env.SYNOLOGY_ALLOWED_FOLDER_PREFIX ?? defaultFolder,
   };
+  return configCache;
 }
 
 function maybeAllowInsecureTls(config: SynologyConfig) {
@@ -189,13 +215,22 @@ async function synologyJsonRequest<T>(config: SynologyConfig, path: string, para
   const result = (await response.json()) as T & { success?: boolean; error?: unknown };
 
   if (!response.ok || !result.success) {
-    throw new Error(`Synology request failed: ${JSON.stringify(result.error ?? response.status)}`);
+    throw synologyRequestError(result.error ?? response.status);
   }
 
   return result;
 }
 
-async function getSynologySid(config: SynologyConfig) {
+function synologyRequestError(detail: unknown) {
+  const code =
+    detail && typeof detail === "object" && "code" in detail ? Number(detail.code) : undefined;
+  if (code !== undefined && SESSION_ERROR_CODES.has(code)) {
+    return new SynologySessionError(`Synology session is no longer valid: ${code}`);
+  }
+  return new Error(`Synology request failed: ${JSON.stringify(detail)}`);
+}
+
+async function loginToSynology(config: SynologyConfig) {
   const params = new URLSearchParams({
     api: "SYNO.API.Auth",
     version: "6",
@@ -213,6 +248,40 @@ async function getSynologySid(config: SynologyConfig) {
   return sid;
 }
 
+async function getSynologySid(config: SynologyConfig) {
+  if (sessionCache && sessionCache.expiresAt > Date.now()) {
+    return sessionCache.sid;
+  }
+
+  if (!pendingLogin) {
+    pendingLogin = loginToSynology(config)
+      .then((sid) => {
+        sessionCache = { sid, expiresAt: Date.now() + SESSION_TTL_MS };
+        return sid;
+      })
+      .finally(() => {
+        pendingLogin = null;
+      });
+  }
+  return pendingLogin;
+}
+
+async function withSynologySession<T>(config: SynologyConfig, request: (sid: string) => Promise<T>) {
+  const sid = await getSynologySid(config);
+  try {
+    return await request(sid);
+  } catch (error) {
+    if (!(error instanceof SynologySessionError)) {
+      throw error;
+    }
+    // Another request may already have logged in again with a fresh sid.
+    if (sessionCache?.sid === sid) {
+      sessionCache = null;
+    }
+    return request(await getSynologySid(config));
+  }
+}
+
 function isImageName(name: string) {
   const extension = name.slice(name.lastIndexOf(".")).toLowerCase();
   return IMAGE_EXTENSIONS.has(extension);
@@ -232,57 +301,82 @@ export async function listSynologyImages(folderPath: string, limit = 300): Promi
     throw new SynologyConfigError("Requested Synology folder is outside the allowed folder prefix.");
   }
 
-  const sid = await getSynologySid(config);
-  const params = new URLSearchParams({
-    api: "SYNO.FileStation.List",
-    version: "2",
-    method: "list",
-    folder_path: folder,
-    filetype: "file",
-    additional: "size,time",
-    sort_by: "name",
-    sort_direction: "asc",
-    _sid: sid,
+  const result = await withSynologySession(config, (sid) => {
+    const params = new URLSearchParams({
+      api: "SYNO.FileStation.List",
+      version: "2",
+      method: "list",
+      folder_path: folder,
+      filetype: "file",
+      additional: "size,time",
+      sort_by: "name",
+      sort_direction: "asc",
+      _sid: sid,
+    });
+    return synologyJsonRequest<SynologyListResponse>(config, "/webapi/entry.cgi", params);
   });
-  const result = await synologyJsonRequest<SynologyListResponse>(config, "/webapi/entry.cgi", params);
   const files = result.data?.files ?? [];
 
   return files
     .filter((file) => file.name && file.path && isImageName(file.name))
     .slice(0, Math.max(1, Math.min(limit, 2000)))
-    .map((file) => ({
-      name: file.name ?? "image",
-      path: file.path ?? "",
-      size: file.additional?.size ?? 0,
-      captureTime: formatSynologyTime(file.additional?.time?.mtime),
-      url: `/api/synology/image?path=${encodeURIComponent(file.path ?? "")}`,
-    }));
+    .map((file) => {
+      const size = file.additional?.size ?? 0;
+      const mtime = file.additional?.time?.mtime;
+      // The modification time versions the URL for browser caching.
+      const version = mtime ? `&v=${mtime}` : "";
+      const url = `/api/synology/image?path=${encodeURIComponent(file.path ?? "")}${version}`;
+
+      return {
+        name: file.name ?? "image",
+        path: file.path ?? "",
+        size,
+        captureTime: formatSynologyTime(mtime),
+        url,
+        thumbnailUrl: size < THUMBNAIL_MIN_BYTES ? url : `${url}&thumbnail=1`,
+      };
+    });
 }
 
-export async function downloadSynologyImage(path: string) {
+export async function downloadSynologyImage(path: string, { thumbnail = false } = {}) {
   const config = getSynologyConfig();
   const normalizedPath = normalizeSynologyPath(path);
   if (!isAllowedSynologyPath(normalizedPath, config.allowedFolderPrefix)) {
     throw new SynologyConfigError("Requested Synology image is outside the allowed folder prefix.");
   }
 
-  const sid = await getSynologySid(config);
-  const params = new URLSearchParams({
-    api: "SYNO.FileStation.Download",
-    version: "2",
-    method: "download",
-    path: JSON.stringify([normalizedPath]),
-    mode: "open",
-    _sid: sid,
-  });
-  maybeAllowInsecureTls(config);
-  const response = await fetch(`${config.baseUrl}/webapi/entry.cgi?${params.toString()}`, {
-    cache: "no-store",
-  });
-
-  if (!response.ok || !response.body) {
-    throw new Error(`Synology image download failed: ${response.status}`);
-  }
+  return withSynologySession(config, async (sid) => {
+    const params = thumbnail
+      ? new URLSearchParams({
+          api: "SYNO.FileStation.Thumb",
+          version: "2",
+          method: "get",
+          path: normalizedPath,
+          size: "medium",
+          _sid: sid,
+        })
+      : new URLSearchParams({
+          api: "SYNO.FileStation.Download",
+          version: "2",
+          method: "download",
+          path: JSON.stringify([normalizedPath]),
+          mode: "open",
+          _sid: sid,
+        });
+    maybeAllowInsecureTls(config);
+    const response = await fetch(`${config.baseUrl}/webapi/entry.cgi?${params.toString()}`, {
+      cache: "no-store",
+    });
+
+    // File Station reports failures, including expired sessions, as JSON.
+    if (response.headers.get("Content-Type")?.includes("application/json")) {
+      const result = (await response.json()) as { error?: unknown };
+      throw synologyRequestError(result.error ?? response.status);
+    }
+    if (!response.ok || !response.body) {
+      throw new Error(`Synology image download failed: ${response.status}`);
+    }
 
-  return response;
+    return response;
+  });
 }